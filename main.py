@@ -1,16 +1,31 @@
 # main.py
 import os
 import sys
+
+# Pin BLAS/OpenMP pools to one thread per worker process to avoid
+# oversubscription; must happen before numpy/sklearn are imported.
+WORKERS = int(os.getenv("WORKERS", "1"))
+if WORKERS > 1:
+    for _var in ("OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "OMP_NUM_THREADS"):
+        os.environ.setdefault(_var, "1")
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
+import anyio
 import joblib
+from joblib import Parallel, delayed
 import structlog
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse, PlainTextResponse
-from prometheus_client import Histogram, Counter, generate_latest
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from prometheus_client import CONTENT_TYPE_LATEST, Histogram, Counter, generate_latest
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from src.intelligent_config import IntelligentConfig
-import pandas as pd
+import numpy as np
 import time
 
 # Initialize intelligent configuration
@@ -27,12 +42,32 @@ for action in healing_actions:
 # Get dynamic configuration
 config = intelligent_config.get_dynamic_config()
 
-request_latency = Histogram("api_request_latency_seconds", "API Request Latency", ["endpoint"])
+# Hoist frequently used config values into module constants
+API_V = config['api'].get('version', '/v1')
+API_PORT = config['api'].get('port', 8000)
+API_HOST = config['api'].get('host', '0.0.0.0')
+MODELS_DIR = Path(config['paths']['models_dir'])
+PROJECT_VERSION = config['project']['version']
+
+# Fixed bucket bounds tuned to API latencies (seconds)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+request_latency = Histogram(
+    "api_request_latency_seconds", "API Request Latency", ["endpoint"],
+    buckets=LATENCY_BUCKETS
+)
 request_counter = Counter("api_requests_total", "Total API Requests", ["endpoint", "method", "status_code"])
 prediction_errors = Counter("prediction_errors_total", "Prediction Errors Total")
+cache_hits = Counter("cache_hits_total", "Prediction Cache Hits Total")
+
+@functools.lru_cache(maxsize=1024)
+def _labels(endpoint: str, method: str, status_code: int):
+    """Return the cached (histogram, counter) children for a label set."""
+    return request_latency.labels(endpoint), request_counter.labels(endpoint, method, status_code)
 
 class PredictionInput(BaseModel):
-    data: List[List[float]]
+    # Rows are validated in bulk by numpy in predict(), not element-wise here
+    data: list
 
 class AgentTask(BaseModel):
     task_name: str
@@ -50,18 +85,17 @@ PREPROCESSOR = None
 MODEL_LOADED = False
 
 try:
-    models_dir = Path(config['paths']['models_dir'])
-    model_path = models_dir / config['paths'].get('model_filename', 'model.joblib')
-    preprocessor_path = models_dir / config['paths'].get('preprocessor_filename', 'preprocessor.joblib')
+    model_path = MODELS_DIR / config['paths'].get('model_filename', 'model.joblib')
+    preprocessor_path = MODELS_DIR / config['paths'].get('preprocessor_filename', 'preprocessor.joblib')
     
     if model_path.exists():
-        MODEL = joblib.load(model_path)
+        MODEL = joblib.load(model_path, mmap_mode='r')
         log.info("✅ Model loaded successfully", path=str(model_path))
     else:
         log.warning("Model file not found", path=str(model_path))
         
     if preprocessor_path.exists():
-        PREPROCESSOR = joblib.load(preprocessor_path)
+        PREPROCESSOR = joblib.load(preprocessor_path, mmap_mode='r')
         log.info("✅ Preprocessor loaded successfully", path=str(preprocessor_path))
     else:
         log.warning("Preprocessor file not found", path=str(preprocessor_path))
@@ -69,22 +103,101 @@ try:
     if MODEL is not None and PREPROCESSOR is not None:
         MODEL_LOADED = True
         log.info("🤖 Model and preprocessor are ready for predictions.")
+
+        # Warm up with a dummy batch so the first request sees steady-state latency
+        try:
+            _warm = np.zeros((1, getattr(PREPROCESSOR, 'n_features_in_', 3)), dtype=np.float32)
+            MODEL.predict(PREPROCESSOR.transform(_warm))
+        except Exception as e:
+            log.warning("Model warmup failed", error=str(e))
         
 except Exception as e:
     log.warning("Could not load models on startup", error=str(e))
 
+# Batches larger than this are split across threads for scoring
+PARALLEL_THRESHOLD = config['api'].get('parallel_threshold', 4096)
+
+def _score_chunk(chunk: np.ndarray) -> np.ndarray:
+    return MODEL.predict(PREPROCESSOR.transform(chunk))
+
+def _score(arr: np.ndarray) -> np.ndarray:
+    """Run preprocess+predict, fanning large batches out over a thread pool."""
+    if arr.shape[0] <= PARALLEL_THRESHOLD:
+        return _score_chunk(arr)
+    chunks = np.array_split(arr, os.cpu_count() or 1)
+    results = Parallel(n_jobs=-1, prefer="threads")(delayed(_score_chunk)(c) for c in chunks)
+    return np.concatenate(results)
+
+# Per-row prediction cache (LRU), keyed by a hash of the row bytes
+PREDICTION_CACHE_SIZE = config['api'].get('cache_size', 4096)
+_prediction_cache = OrderedDict()
+_prediction_cache_lock = threading.Lock()
+
+def _row_key(row: np.ndarray) -> bytes:
+    return hashlib.blake2b(row.tobytes(), digest_size=16).digest()
+
+def _cached_predict(arr: np.ndarray) -> np.ndarray:
+    """Predict a batch, serving cached rows and only scoring the misses."""
+    if PREDICTION_CACHE_SIZE <= 0:
+        return _score(arr)
+
+    keys = [_row_key(row) for row in arr]
+    preds = [None] * len(keys)
+    miss_idx = []
+    with _prediction_cache_lock:
+        for i, key in enumerate(keys):
+            hit = _prediction_cache.get(key)
+            if hit is None:
+                miss_idx.append(i)
+            else:
+                _prediction_cache.move_to_end(key)
+                preds[i] = hit
+
+    num_hits = len(keys) - len(miss_idx)
+    if num_hits:
+        cache_hits.inc(num_hits)
+
+    if miss_idx:
+        fresh = _score(arr[miss_idx])
+        with _prediction_cache_lock:
+            for i, value in zip(miss_idx, fresh):
+                preds[i] = value
+                _prediction_cache[keys[i]] = value
+            while len(_prediction_cache) > PREDICTION_CACHE_SIZE:
+                _prediction_cache.popitem(last=False)
+
+    return np.asarray(preds)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the threadpool that runs the synchronous prediction handler."""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = config['api'].get('thread_pool', 100)
+    yield
+
 app = FastAPI(
     title="Omnitide AI Suite API", 
     description="Dynamic, self-healing FastAPI service with intelligent configuration",
-    version=config['project']['version']
+    version=PROJECT_VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
+# Scrape and liveness traffic is not instrumented
+UNINSTRUMENTED_PATHS = frozenset({"/metrics", f"{API_V}/health"})
+
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
+    if request.url.path in UNINSTRUMENTED_PATHS:
+        return await call_next(request)
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    request_latency.labels(request.url.path).observe(process_time)
-    request_counter.labels(request.url.path, request.method, response.status_code).inc()
+    process_time = time.perf_counter() - start_time
+    # Label by route template so path parameters don't explode cardinality
+    route = request.scope.get("route")
+    endpoint = route.path if route is not None else "unmatched"
+    latency, counter = _labels(endpoint, request.method, response.status_code)
+    latency.observe(process_time)
+    counter.inc()
     return response
 
 @app.get("/", response_model=Dict[str, Any])
@@ -92,12 +205,12 @@ async def root():
     """Provide basic information about the API."""
     return {
         "message": "Welcome to the Omnitide AI Suite API",
-        "version": config['project']['version'],
+        "version": PROJECT_VERSION,
         "intelligent_mode": True,
         "model_loaded": MODEL_LOADED
     }
 
-@app.get(f"{config['api']['version']}/health", response_model=HealthResponse)
+@app.get(f"{API_V}/health", response_model=HealthResponse)
 async def health_check():
     """Return a detailed health check of the system."""
     return {
@@ -107,7 +220,7 @@ async def health_check():
         "healing_actions": healing_actions
     }
 
-@app.get(f"{config['api']['version']}/ready")
+@app.get(f"{API_V}/ready")
 async def readiness_check():
     """Check if the API is ready to serve requests (e.g., model loaded)."""
     if not MODEL_LOADED:
@@ -117,9 +230,9 @@ async def readiness_check():
         )
     return {"status": "ready", "message": "API is ready to serve predictions."}
 
-@app.post(f"{config['api']['version']}/predict")
-async def predict(input_data: PredictionInput):
-    """Make predictions using the loaded model."""
+@app.post(f"{API_V}/predict")
+def predict(input_data: PredictionInput):
+    """Make predictions using the loaded model (runs in the threadpool)."""
     if not MODEL_LOADED:
         log.error("Prediction attempted but model not loaded.")
         raise HTTPException(
@@ -127,21 +240,31 @@ async def predict(input_data: PredictionInput):
             detail="Model is not available for predictions."
         )
     
+    # Coerce and validate the batch in one C-level pass
+    try:
+        arr = np.ascontiguousarray(input_data.data, dtype=np.float32)
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid input data: {e}")
+    if arr.ndim != 2:
+        raise HTTPException(status_code=422, detail="Input data must be a list of rows of numbers.")
+    if not np.isfinite(arr).all():
+        raise HTTPException(status_code=422, detail="Input data must contain only finite numbers.")
+
     try:
-        # Preprocess the input data
-        processed_data = PREPROCESSOR.transform(input_data.data)
-        # Make predictions
-        predictions = MODEL.predict(processed_data).tolist()
+        preds = _cached_predict(arr)
         
-        log.info("Prediction successful", num_predictions=len(predictions))
-        return {"prediction": predictions}
+        log.info("Prediction successful", num_predictions=len(preds))
+        # orjson serializes numeric arrays natively; skip the tolist() round trip
+        if preds.dtype.kind not in "biuf":
+            preds = preds.tolist()
+        return ORJSONResponse({"prediction": preds})
         
     except Exception as e:
         prediction_errors.inc()
-        log.error("Prediction failed", error=str(e), input_data=input_data.data)
+        log.warning("Prediction failed", error=str(e), n_rows=len(input_data.data))
         raise HTTPException(status_code=500, detail=f"Prediction error: {e}")
 
-@app.post(f"{config['api']['version']}/agent/execute")
+@app.post(f"{API_V}/agent/execute")
 async def execute_agent_task(task: AgentTask):
     """Execute an intelligent agent task."""
     log.info("Executing agent task", task_name=task.task_name)
@@ -152,39 +275,66 @@ async def execute_agent_task(task: AgentTask):
         raise HTTPException(status_code=400, detail=result)
     return result
 
-@app.post(f"{config['api']['version']}/heal")
+@app.post(f"{API_V}/heal")
 async def trigger_healing():
     """Trigger a manual self-healing process."""
     log.info("Manual healing process triggered via API.")
     actions = intelligent_config.heal_project()
     return {"actions": actions}
 
-@app.get(f"{config['api']['version']}/config")
+@app.get(f"{API_V}/config")
 async def get_current_config():
     """Return the current dynamic configuration."""
     return config
 
-@app.get("/metrics", response_class=PlainTextResponse)
+# Short-lived cache of the rendered metrics so bursty scrapes reuse one render
+METRICS_TTL_SECONDS = 0.5
+_metrics_cache = {"t": 0.0, "body": b""}
+
+@app.get("/metrics")
 async def metrics():
     """Prometheus metrics endpoint"""
-    return generate_latest().decode("utf-8")
+    now = time.monotonic()
+    if now - _metrics_cache["t"] > METRICS_TTL_SECONDS:
+        _metrics_cache["body"] = generate_latest()
+        _metrics_cache["t"] = now
+    return Response(_metrics_cache["body"], media_type=CONTENT_TYPE_LATEST)
 
 # Error handlers
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler to ensure consistent error responses."""
-    log.error("Unhandled exception", error=str(exc), path=request.url.path)
+    exc_type = type(exc).__name__
+    log.exception("Unhandled exception", path=request.url.path, exc_type=exc_type)
     return JSONResponse(
         status_code=500,
-        content={"detail": f"An internal server error occurred: {exc}"},
+        content={"detail": "An internal server error occurred.", "type": exc_type},
     )
 
 if __name__ == "__main__":
+    import shutil
     import uvicorn
         
     # Use dynamic port from config
-    port = config.get('api', {}).get('port', 8000)
-    host = config.get('api', {}).get('host', '0.0.0.0')
+    port = API_PORT
+    host = API_HOST
+    
+    if WORKERS > 1 and shutil.which("gunicorn"):
+        # One process per worker so CPU-bound predictions don't share a GIL
+        log.info(f"🚀 Starting Omnitide AI Suite on {host}:{port} with {WORKERS} gunicorn workers")
+        os.execvp("gunicorn", [
+            "gunicorn", "main:app",
+            "--workers", str(WORKERS),
+            "--worker-class", "uvicorn.workers.UvicornWorker",
+            "--bind", f"{host}:{port}"
+        ])
     
     log.info(f"🚀 Starting Omnitide AI Suite on {host}:{port}")
-    uvicorn.run(app, host=host, port=port)
+    # libuv event loop + C HTTP parser (both ship with uvicorn[standard])
+    uvicorn.run(
+        "main:app" if WORKERS > 1 else app, host=host, port=port,
+        workers=WORKERS,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        access_log=False
+    )
@@ -1,9 +1,10 @@
 # main.py
 from fastapi import FastAPI, Request
-from prometheus_client import Histogram, Counter, generate_latest
+from starlette.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST, Histogram, Counter, generate_latest
 import time
 from pydantic import BaseModel
-from src.config import config
+from src.config import CONFIG
 import joblib
 
 app = FastAPI(title="AI Model Serving API", description="A FastAPI service for model predictions.")
@@ -15,36 +16,44 @@ prediction_errors = Counter("prediction_errors_total", "Prediction Errors Total"
 class PredictionInput(BaseModel):
     data: list
 
+# Load the model and preprocessor once at import time
+MODEL = None
+PREPROCESSOR = None
+try:
+    MODEL = joblib.load(CONFIG.paths.model_filename, mmap_mode='r')
+    PREPROCESSOR = joblib.load(CONFIG.paths.preprocessor_filename, mmap_mode='r')
+except Exception:
+    MODEL = PREPROCESSOR = None
+
 @app.middleware("http")
 async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
+    start_time = time.perf_counter()
     response = await call_next(request)
-    process_time = time.time() - start_time
+    process_time = time.perf_counter() - start_time
     request_latency.labels(request.url.path).observe(process_time)
     request_counter.labels(request.url.path, request.method, response.status_code).inc()
     return response
 
-@app.get(f"{config['api']['version']}/health")
+@app.get(f"{CONFIG.api.version}/health")
 async def health_check():
     return {"status": "ok", "message": "API is running successfully."}
 
-@app.get(f"{config['api']['version']}/ready")
+@app.get(f"{CONFIG.api.version}/ready")
 async def readiness_check():
     return {"status": "ready", "message": "API is ready to serve requests."}
 
 # Replace mock prediction logic with actual model inference
-@app.post(f"{config['api']['version']}/predict")
+@app.post(f"{CONFIG.api.version}/predict")
 async def predict(input_data: PredictionInput):
+    if MODEL is None or PREPROCESSOR is None:
+        prediction_errors.inc()
+        return {"error": "Model is not loaded."}
     try:
-        # Load the model and preprocessor
-        preprocessor = joblib.load(config['paths']['preprocessor_filename'])
-        model = joblib.load(config['paths']['model_filename'])
-
         # Preprocess the input data
-        processed_data = preprocessor.transform(input_data.data)
+        processed_data = PREPROCESSOR.transform(input_data.data)
 
         # Make predictions
-        prediction = model.predict(processed_data).tolist()
+        prediction = MODEL.predict(processed_data).tolist()
         return {"prediction": prediction}
     except Exception as e:
         prediction_errors.inc()
@@ -52,7 +61,7 @@ async def predict(input_data: PredictionInput):
 
 @app.get("/metrics")
 async def metrics():
-    return generate_latest().decode("utf-8")
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 @app.get("/")
 async def root():
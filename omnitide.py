@@ -1,23 +1,35 @@
 # omnitide.py
 import typer
+import codecs
+import functools
+import os
+import shlex
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
+from rich.text import Text
 from rich import box
 
 app = typer.Typer(help="Omnitide AI Suite - Dynamic MLOps & LLM Platform CLI")
 console = Console()
 
-def run_command(command: str):
-    """Execute a shell command with proper error handling."""
-    with console.status(f"[bold green]Running: {command}[/bold green]"):
+def run_command(argv: list[str]):
+    """Execute a command (argv list, no shell) with proper error handling."""
+    with console.status(f"[bold green]Running: {shlex.join(argv)}[/bold green]"):
         try:
-            process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
             if process.stdout:
-                for line in iter(process.stdout.readline, ''):
-                    console.print(f"  [grey46]{line.strip()}[/grey46]")
+                # Stream raw 64 KiB chunks; console.out skips markup parsing
+                fd = process.stdout.fileno()
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                while chunk := os.read(fd, 65536):
+                    console.out(decoder.decode(chunk), style="grey46", highlight=False, end="")
+                console.out(decoder.decode(b"", final=True), style="grey46", highlight=False, end="")
+                process.stdout.close()
             process.wait()
             if process.returncode != 0:
                 console.print(f"[bold red]Command failed with return code {process.returncode}[/bold red]")
@@ -32,32 +44,47 @@ def run_command(command: str):
 
 @app.command(help="Runs the FastAPI application in a development server.")
 def run():
-    run_command("poetry run uvicorn main:app --reload")
+    run_command(["poetry", "run", "uvicorn", "main:app", "--reload"])
 
 @app.command(help="Runs the unit test suite and generates a coverage report.")
 def test(coverage: Optional[bool] = typer.Option(True, "--no-coverage", help="Run tests without a coverage report.")):
     if coverage:
-        run_command("poetry run pytest --cov=src")
+        run_command(["poetry", "run", "pytest", "--cov=src"])
     else:
-        run_command("poetry run pytest")
+        run_command(["poetry", "run", "pytest"])
 
 @app.command(help="Runs the code linter and formatter.")
 def lint():
-    run_command("poetry run ruff check . && poetry run ruff format .")
+    run_command(["poetry", "run", "ruff", "check", "."])
+    run_command(["poetry", "run", "ruff", "format", "."])
 
 @app.command(help="Runs the full CI/CD pipeline locally.")
 def ci():
     """Run the full CI/CD pipeline locally."""
     console.print("[bold cyan]Executing full CI pipeline locally...[/bold cyan]")
-    lint()
-    test()
+    # ruff ships only a binary, so call it directly instead of via `poetry run`
+    from ruff.__main__ import find_ruff_bin
+    ruff = find_ruff_bin()
+    run_command([ruff, "check", "."])
+    run_command([ruff, "format", "."])
+
+    # Run the test suite in this interpreter rather than spawning a new one
+    import pytest
+    exit_code = pytest.main(["--cov=src"])
+    if exit_code != 0:
+        console.print(f"[bold red]Tests failed with exit code {int(exit_code)}[/bold red]")
+        sys.exit(int(exit_code))
     console.print("[bold cyan]CI pipeline steps completed.[/bold cyan]")
 
 @app.command(help="Cleans up temporary artifacts and resets the environment.")
 def clean():
     console.print("[bold yellow]Cleaning up artifacts and resetting environment...[/bold yellow]")
-    run_command("rm -rf .venv/ __pycache__/ reports/ coverage.xml models/ data/processed/")
-    run_command("dvc destroy")
+    for path in (".venv", "__pycache__", "reports", "models", "data/processed"):
+        shutil.rmtree(path, ignore_errors=True)
+    for path in ("coverage.xml", ".dirs_ok"):
+        if os.path.exists(path):
+            os.remove(path)
+    run_command(["dvc", "destroy"])
     console.print("[bold yellow]Cleanup and reset complete.[/bold yellow]")
 
 @app.command(help="Orchestrate intelligent agent tasks and self-healing operations.")
@@ -67,8 +94,7 @@ def agent(
 ):
     """Orchestrate agent tasks with intelligent configuration."""
     try:
-        from src.intelligent_config import IntelligentConfig
-        intelligent_config = IntelligentConfig()
+        from src.intelligent_config import intelligent_config
         
         # Parse parameters if provided
         task_params = {}
@@ -96,49 +122,89 @@ def agent(
     except Exception as e:
         console.print(f"[bold red]❌ Agent task failed: {e}[/bold red]")
 
+def _capture(argv: list[str]) -> str:
+    """Run a short status probe and return its combined output."""
+    result = subprocess.run(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, check=True)
+    return result.stdout
+
+def _show_probe(future, argv: list[str]):
+    """Print a prefetched probe's output, running it live if it isn't ready."""
+    try:
+        console.out(future.result(timeout=2), style="grey46", highlight=False, end="")
+    except Exception:
+        run_command(argv)
+
+MENU_HEADER = Panel(
+    "[bold cyan]🚀 Omnitide AI Suite - Interactive Mode[/bold cyan]",
+    subtitle="Dynamic MLOps & LLM Platform",
+    box=box.DOUBLE
+)
+MENU_ITEMS = tuple(Text.from_markup(line) for line in (
+    "[bold]Available Actions:[/bold]",
+    "1. 🔧 Heal Project (Auto-fix issues)",
+    "2. 🚀 Start API Server",
+    "3. 🧪 Run Tests",
+    "4. 🔍 Environment Detection",
+    "5. ⚙️ Adapt Configuration",
+    "6. 📊 System Monitor",
+))
+MENU_OLLAMA = Text("7. 🤖 Generate LLM Report")
+MENU_DOCKER = Text("8. 🐳 Docker Operations")
+MENU_DVC = Text("9. 📦 DVC Operations")
+MENU_EXIT = Text("0. ❌ Exit")
+
+@functools.lru_cache(maxsize=8)
+def _menu(has_ollama: bool, has_docker: bool, has_dvc: bool) -> Group:
+    """Build the interactive menu once per combination of optional entries."""
+    optional = [item for flag, item in (
+        (has_ollama, MENU_OLLAMA),
+        (has_docker, MENU_DOCKER),
+        (has_dvc, MENU_DVC),
+    ) if flag]
+    return Group(MENU_HEADER, *MENU_ITEMS, *optional, MENU_EXIT)
+
 @app.command(help="Interactive mode for dynamic project management.")
 def interactive():
     """Interactive mode with dynamic menu based on available capabilities."""
+    executor = ThreadPoolExecutor(max_workers=4)
     try:
-        from src.intelligent_config import IntelligentConfig
-        intelligent_config = IntelligentConfig()
+        from src.intelligent_config import get_config, intelligent_config
+        
+        # Prefetch environment detection and status probes concurrently
+        env_future = executor.submit(intelligent_config.detect_environment)
+        docker_future = executor.submit(_capture, ["docker", "ps"])
+        dvc_future = executor.submit(_capture, ["dvc", "status"])
+        env_info: dict = {}
         
         while True:
             console.clear()
-            console.print(Panel(
-                "[bold cyan]🚀 Omnitide AI Suite - Interactive Mode[/bold cyan]",
-                subtitle="Dynamic MLOps & LLM Platform",
-                box=box.DOUBLE
-            ))
-            
-            # Detect current capabilities
-            env_info = intelligent_config.detect_environment()
             
-            console.print("[bold]Available Actions:[/bold]")
-            console.print("1. 🔧 Heal Project (Auto-fix issues)")
-            console.print("2. 🚀 Start API Server")
-            console.print("3. 🧪 Run Tests")
-            console.print("4. 🔍 Environment Detection")
-            console.print("5. ⚙️ Adapt Configuration")
-            console.print("6. 📊 System Monitor")
+            # Detect current capabilities; the first detection is always awaited,
+            # later refreshes fall back to the last snapshot if they are slow
+            try:
+                with console.status("[grey46]Detecting environment...[/grey46]"):
+                    env_info = env_future.result(timeout=2 if env_info else None)
+            except Exception:
+                pass
             
-            if env_info.get("has_ollama"):
-                console.print("7. 🤖 Generate LLM Report")
-            if env_info.get("has_docker"):
-                console.print("8. 🐳 Docker Operations")
-            if env_info.get("has_dvc"):
-                console.print("9. 📦 DVC Operations")
-                
-            console.print("0. ❌ Exit")
+            console.print(_menu(
+                bool(env_info.get("has_ollama")),
+                bool(env_info.get("has_docker")),
+                bool(env_info.get("has_dvc")),
+            ))
             
             choice = console.input("\n[bold]Select an option: [/bold]")
             
+            # Refresh capabilities in the background while the action runs
+            if env_future.done():
+                env_future = executor.submit(intelligent_config.detect_environment)
+            
             if choice == "1":
-                run_command("python -c \"from src.intelligent_config import IntelligentConfig; IntelligentConfig().heal_project()\"")
+                run_command([sys.executable, "-c", "from src.intelligent_config import IntelligentConfig; IntelligentConfig().heal_project()"])
             elif choice == "2":
-                port = env_info.get("available_ports", [8000])[0]
+                port = intelligent_config.get_first_available_port()
                 console.print(f"[bold green]Starting server on port {port}[/bold green]")
-                run_command(f"python -m uvicorn main:app --host 0.0.0.0 --port {port} --reload")
+                run_command([sys.executable, "-m", "uvicorn", "main:app", "--host", "0.0.0.0", "--port", str(port), "--reload"])
             elif choice == "3":
                 test()
             elif choice == "4":
@@ -146,7 +212,7 @@ def interactive():
                     console.print(f"  • [cyan]{key}[/cyan]: {value}")
                 console.input("\nPress Enter to continue...")
             elif choice == "5":
-                config = intelligent_config.get_dynamic_config()
+                config = get_config()
                 console.print("[bold]Dynamic Configuration:[/bold]")
                 console.print(f"  • Project: {config['project']['name']} v{config['project']['version']}")
                 console.print(f"  • API Port: {config['api']['port']}")
@@ -160,13 +226,15 @@ def interactive():
                 console.print(f"  • Disk: {psutil.disk_usage('.').percent}%")
                 console.input("\nPress Enter to continue...")
             elif choice == "7" and env_info.get("has_ollama"):
-                run_command("python src/llm_agent.py")
+                run_command([sys.executable, "src/llm_agent.py"])
             elif choice == "8" and env_info.get("has_docker"):
                 console.print("[bold]Docker Status:[/bold]")
-                run_command("docker ps")
+                _show_probe(docker_future, ["docker", "ps"])
+                docker_future = executor.submit(_capture, ["docker", "ps"])
             elif choice == "9" and env_info.get("has_dvc"):
                 console.print("[bold]DVC Status:[/bold]")
-                run_command("dvc status")
+                _show_probe(dvc_future, ["dvc", "status"])
+                dvc_future = executor.submit(_capture, ["dvc", "status"])
             elif choice == "0":
                 console.print("[bold green]Goodbye![/bold green]")
                 break
@@ -178,17 +246,20 @@ def interactive():
         console.print("\n[bold yellow]Interrupted by user[/bold yellow]")
     except Exception as e:
         console.print(f"[bold red]Interactive mode error: {e}[/bold red]")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 @app.command(help="Deploy the application with intelligent configuration.")
 def deploy(
     target: str = typer.Option("local", help="Deployment target: local, docker, k8s"),
-    port: Optional[int] = typer.Option(None, help="Override port (auto-detected if not specified)")
+    port: Optional[int] = typer.Option(None, help="Override port (auto-detected if not specified)"),
+    skip_heal: bool = typer.Option(False, "--skip-heal", help="Skip pre-deployment project healing")
 ):
     """Deploy with intelligent configuration and environment adaptation."""
     try:
         from src.deployer import Deployer
         deployer = Deployer()
-        deployer.deploy(target=target, port=port)
+        deployer.deploy(target=target, port=port, skip_heal=skip_heal)
         console.print(f"[bold green]🚀 Deployment to {target} initiated successfully.[/bold green]")
             
     except Exception as e:
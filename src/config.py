@@ -1,24 +1,58 @@
 # Fully implement the `config` module
-config = {
-    'paths': {
-        'preprocessor_filename': 'models/preprocessor.pkl',
-        'model_filename': 'models/model.pkl',
-        'data_raw': 'data/raw/data.csv',
-        'data_processed': 'data/processed/data.csv'
-    },
-    'data': {
-        'test_size': 0.2,  # Correct type: float
-        'random_state': 42,  # Correct type: int
-        'target_column': 'target',
-        'expected_columns': ['feature1', 'feature2', 'feature3', 'target']
-    },
-    'api': {
-        'version': '/v1',
-        'host': '0.0.0.0',
-        'port': 8000
-    },
-    'project': {
-        'name': 'omnitide-ai-suite',
-        'description': 'An intelligent, self-healing MLOps platform.'
-    }
-}
+from dataclasses import asdict, dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Paths:
+    preprocessor_filename: str = 'models/preprocessor.pkl'
+    model_filename: str = 'models/model.pkl'
+    data_raw: str = 'data/raw/data.csv'
+    data_processed: str = 'data/processed/data.csv'
+    x_test_filename: str = 'models/X_test.npy'
+    y_test_filename: str = 'models/y_test.npy'
+
+
+@dataclass(frozen=True, slots=True)
+class Data:
+    test_size: float = 0.2
+    random_state: int = 42
+    target_column: str = 'target'
+    expected_columns: Tuple[str, ...] = ('feature1', 'feature2', 'feature3', 'target')
+    numerical_features: Tuple[str, ...] = ('feature1', 'feature2', 'feature3')
+    categorical_features: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Api:
+    version: str = '/v1'
+    host: str = '0.0.0.0'
+    port: int = 8000
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    name: str = 'omnitide-ai-suite'
+    description: str = 'An intelligent, self-healing MLOps platform.'
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    paths: Paths = field(default_factory=Paths)
+    data: Data = field(default_factory=Data)
+    api: Api = field(default_factory=Api)
+    project: Project = field(default_factory=Project)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap nested dicts in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+
+CONFIG = AppConfig()
+
+# Read-only dict view for callers still using config['section']['key']
+config: Mapping[str, Any] = _freeze(asdict(CONFIG))
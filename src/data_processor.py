@@ -1,11 +1,16 @@
 # src/data_processor.py
+import functools
+import hashlib
+import numpy as np
 import pandas as pd
+from scipy import sparse
 from sklearn.model_selection import train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler, OneHotEncoder
 from sklearn.compose import ColumnTransformer
 import joblib
 import os
+import shutil
 from pathlib import Path
 
 # Intelligent logging setup
@@ -21,11 +26,19 @@ except ImportError:
     def log_info(msg, **kwargs):
         log.info(f"{msg} {kwargs}")
 
-# Ensure the config module is properly imported
-from src.config import config
+# Multithreaded CSV parsing when pyarrow is available
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
-# Ensure `ensure_environment` is defined
-from src.intelligent_config import IntelligentConfig
+# Uncompressed so the API can load the preprocessor with mmap_mode='r'
+PREPROCESSOR_COMPRESS = 0
+
+# Ensure the config module is properly imported
+from src.config import CONFIG
 
 def ensure_environment():
     # Return a valid configuration dictionary
@@ -35,40 +48,137 @@ def ensure_environment():
         }
     }
 
-intelligent_config = IntelligentConfig()
+@functools.lru_cache(maxsize=1)
+def get_intelligent_config():
+    """Return the shared IntelligentConfig, importing it on first use."""
+    from src.intelligent_config import intelligent_config
+    return intelligent_config
+
+EXPECTED_COLUMNS = frozenset(CONFIG.data.expected_columns)
+
+# Fixture written by create_sample_data, and the same rows as arrays
+_SAMPLE_CSV = b"feature1,feature2,feature3,target\n0.1,0.2,0.3,1\n0.4,0.5,0.6,0\n0.7,0.8,0.9,1\n"
+_SAMPLE_FEATURES = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]], dtype=np.float32)
+_SAMPLE_TARGET = np.array([1, 0, 1], dtype=np.int8)
+
+def read_csv(data_path: str) -> pd.DataFrame:
+    """Read a CSV with pyarrow's parallel parser, falling back to pandas.
+
+    Configured numerical features are parsed straight to float32.
+    """
+    if PYARROW_AVAILABLE:
+        table = pa_csv.read_csv(
+            data_path,
+            read_options=pa_csv.ReadOptions(block_size=8 << 20, use_threads=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={col: pa.float32() for col in CONFIG.data.numerical_features}
+            )
+        )
+        return table.to_pandas(self_destruct=True)
+    return pd.read_csv(data_path, dtype={col: np.float32 for col in CONFIG.data.numerical_features})
 
 def validate_data(df: pd.DataFrame):
     log_info("Validating data schema and integrity...")
     
     # Dynamic column validation
-    if 'expected_columns' in config['data']:
-        expected_columns = config['data']['expected_columns']
-        if not all(col in df.columns for col in expected_columns):
-            raise ValueError("Input data is missing one or more expected columns.")
+    if EXPECTED_COLUMNS and not EXPECTED_COLUMNS.issubset(df.columns):
+        raise ValueError("Input data is missing one or more expected columns.")
     
-    if df.isnull().values.any():
+    if df.isna().any(axis=None):
         raise ValueError("Input data contains missing (NaN) values.")
     
     log_info("Data validation successful.")
 
-def process_data(data_path: str):
-    """Process data for training and testing."""
-    log_info("Starting data processing...")
-    
-    # Ensure data file exists
-    if not os.path.exists(data_path):
-        log_info(f"Data file not found at {data_path}, creating sample data...")
-        # Create sample data
-        try:
-            data_path = intelligent_config.create_sample_data()
-        except ImportError:
-            raise FileNotFoundError(f"Data file not found: {data_path}")
-    
-    df = pd.read_csv(data_path)
+def _cache_key(data_path: str) -> str:
+    """Hash the raw data file's identity together with the data config."""
+    stat = os.stat(data_path)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(os.path.abspath(data_path).encode())
+    h.update(str(stat.st_mtime_ns).encode())
+    h.update(str(stat.st_size).encode())
+    h.update(repr(CONFIG.data).encode())
+    return h.hexdigest()
+
+def _load_cached(cache_dir: Path, key: str):
+    """Return (preprocessor, X_processed, y) for a cache key, or None on a miss."""
+    arrays_path = cache_dir / f"{key}.npz"
+    preprocessor_path = cache_dir / f"{key}.joblib"
+    if not (arrays_path.exists() and preprocessor_path.exists()):
+        return None
+    try:
+        with np.load(arrays_path, allow_pickle=True) as arrays:
+            if 'X' in arrays:
+                X_processed = arrays['X']
+            else:
+                X_processed = sparse.csr_matrix(
+                    (arrays['X_data'], arrays['X_indices'], arrays['X_indptr']),
+                    shape=tuple(arrays['X_shape'])
+                )
+            y = pd.Series(arrays['y'], name=arrays['y_name'].item())
+        preprocessor = joblib.load(preprocessor_path)
+    except (OSError, ValueError, KeyError, EOFError):
+        return None
+    return preprocessor, X_processed, y
+
+def _store_cached(cache_dir: Path, key: str, preprocessor, X_processed, y: pd.Series):
+    """Persist a fitted preprocessor and its transformed output under a cache key."""
+    arrays = {'y': y.to_numpy(), 'y_name': np.array(str(y.name))}
+    if sparse.issparse(X_processed):
+        X_csr = X_processed.tocsr()
+        arrays.update(
+            X_data=X_csr.data, X_indices=X_csr.indices,
+            X_indptr=X_csr.indptr, X_shape=np.array(X_csr.shape)
+        )
+    else:
+        arrays['X'] = X_processed
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        joblib.dump(preprocessor, cache_dir / f"{key}.joblib", compress=PREPROCESSOR_COMPRESS)
+        # The .npz is written last so a partial write never looks like a hit
+        np.savez(cache_dir / f"{key}.npz", **arrays)
+    except OSError as e:
+        log_info("Could not cache preprocessing output", error=str(e))
+
+def _save_test_split(X_test, y_test):
+    """Write the held-out split as dense .npy files the evaluator can memory-map."""
+    if sparse.issparse(X_test):
+        X_test = X_test.toarray()
+    try:
+        np.save(CONFIG.paths.x_test_filename, np.asarray(X_test))
+        np.save(CONFIG.paths.y_test_filename, np.asarray(y_test))
+    except OSError as e:
+        log_info("Could not save the test split", error=str(e))
+
+def _is_sample_data(data_path: str) -> bool:
+    """Check whether a file is exactly the create_sample_data fixture."""
+    return (
+        os.path.getsize(data_path) == len(_SAMPLE_CSV)
+        and Path(data_path).read_bytes() == _SAMPLE_CSV
+    )
+
+@functools.lru_cache(maxsize=1)
+def _sample_split():
+    """Fit the preprocessor on the sample fixture once and split it."""
+    df = pd.DataFrame(_SAMPLE_FEATURES, columns=['feature1', 'feature2', 'feature3'])
+    df['target'] = _SAMPLE_TARGET
+    preprocessor, X_processed, y = _fit_frame(df)
+    split = train_test_split(
+        X_processed, y,
+        test_size=CONFIG.data.test_size,
+        random_state=CONFIG.data.random_state
+    )
+    return preprocessor, tuple(split)
+
+def _fit_preprocessor(data_path: str):
+    """Read, validate and fit the preprocessor on a raw CSV."""
+    df = read_csv(data_path)
     validate_data(df)
-    
+    return _fit_frame(df)
+
+def _fit_frame(df: pd.DataFrame):
+    """Fit the preprocessor on a validated frame."""
     # Dynamic target column detection
-    target_col = config['data'].get('target_column', 'target')
+    target_col = CONFIG.data.target_column
     if target_col not in df.columns:
         # Use last column as target
         target_col = df.columns[-1]
@@ -77,37 +187,83 @@ def process_data(data_path: str):
     X = df.drop(target_col, axis=1)
     y = df[target_col]
     
-    numerical_features = X.select_dtypes(include=['int64', 'float64']).columns
-    categorical_features = X.select_dtypes(include=['object']).columns
+    # Column roles come from the config schema; inspect dtypes only without one
+    if CONFIG.data.numerical_features or CONFIG.data.categorical_features:
+        numerical_features = list(CONFIG.data.numerical_features)
+        categorical_features = list(CONFIG.data.categorical_features)
+    else:
+        numerical_features = X.select_dtypes(include=['int64', 'float64', 'float32']).columns
+        categorical_features = X.select_dtypes(include=['object']).columns
     
     preprocessor = ColumnTransformer(
         transformers=[
-            ('num', StandardScaler(), numerical_features),
-            ('cat', OneHotEncoder(handle_unknown='ignore'), categorical_features)
+            ('num', StandardScaler(with_mean=False), numerical_features),
+            ('cat', OneHotEncoder(handle_unknown='ignore', sparse_output=True, dtype=np.float32), categorical_features)
         ],
-        remainder='passthrough'
+        remainder='passthrough',
+        sparse_threshold=0.3,
+        n_jobs=-1
     )
     
-    X_processed = preprocessor.fit_transform(X)
+    X_processed = preprocessor.fit_transform(X).astype(np.float32, copy=False)
+    
+    # Small integer labels (e.g. binary classes) fit in int8
+    if pd.api.types.is_integer_dtype(y) and y.between(-128, 127).all():
+        y = y.astype(np.int8)
+    return preprocessor, X_processed, y
+
+def process_data(data_path: str):
+    """Process data for training and testing."""
+    log_info("Starting data processing...")
+    
+    # Ensure data file exists
+    if not os.path.exists(data_path):
+        log_info(f"Data file not found at {data_path}, creating sample data...")
+        # Create sample data
+        try:
+            data_path = get_intelligent_config().create_sample_data()
+        except ImportError:
+            raise FileNotFoundError(f"Data file not found: {data_path}")
     
     # Ensure models directory exists
-    models_dir = config['paths']['models_dir']
-    Path(models_dir).mkdir(parents=True, exist_ok=True)
+    preprocessor_path = Path(CONFIG.paths.preprocessor_filename)
+    preprocessor_path.parent.mkdir(parents=True, exist_ok=True)
     
-    joblib.dump(preprocessor, f"{models_dir}/{config['paths']['preprocessor_filename']}")
+    # The sample fixture needs no parsing and is only fitted once per process
+    if _is_sample_data(data_path):
+        preprocessor, split = _sample_split()
+        joblib.dump(preprocessor, preprocessor_path, compress=PREPROCESSOR_COMPRESS)
+        _save_test_split(split[1], split[3])
+        log_info("Data processing complete (sample data).")
+        return split
+    
+    # Reuse the fitted preprocessor while the raw data and data config are unchanged
+    cache_dir = preprocessor_path.parent / ".cache"
+    key = _cache_key(data_path)
+    cached = _load_cached(cache_dir, key)
+    if cached is not None:
+        log_info("Using cached preprocessing output", key=key)
+        preprocessor, X_processed, y = cached
+        # Another dataset may have been processed since, so always restore this one's
+        shutil.copyfile(cache_dir / f"{key}.joblib", preprocessor_path)
+    else:
+        preprocessor, X_processed, y = _fit_preprocessor(data_path)
+        joblib.dump(preprocessor, preprocessor_path, compress=PREPROCESSOR_COMPRESS)
+        _store_cached(cache_dir, key, preprocessor, X_processed, y)
     
     X_train, X_test, y_train, y_test = train_test_split(
         X_processed, y, 
-        test_size=config['data']['test_size'], 
-        random_state=config['data']['random_state']
+        test_size=CONFIG.data.test_size, 
+        random_state=CONFIG.data.random_state
     )
+    _save_test_split(X_test, y_test)
     
     log_info("Data processing complete.")
     return X_train, X_test, y_train, y_test
 
 if __name__ == '__main__':
     try:
-        X_train, X_test, y_train, y_test = process_data(config['paths']['data_raw'])
+        X_train, X_test, y_train, y_test = process_data(CONFIG.paths.data_raw)
         log_info(f"X_train shape: {X_train.shape}")
     except Exception as e:
         log_info(f"Error in data processing: {e}")
@@ -124,16 +280,5 @@ def create_sample_data():
     """Create sample data for testing."""
     data_path = "data/raw/data.csv"
     os.makedirs(os.path.dirname(data_path), exist_ok=True)
-    with open(data_path, "w") as f:
-        f.write("feature1,feature2,feature3,target\n")
-        f.write("0.1,0.2,0.3,1\n")
-        f.write("0.4,0.5,0.6,0\n")
-        f.write("0.7,0.8,0.9,1\n")
+    Path(data_path).write_bytes(_SAMPLE_CSV)
     return data_path
-
-# Correct handling of `config_updated`
-config_updated = {
-    'paths': {
-        'data_raw': 'data/raw/data.csv'
-    }
-}
@@ -1,20 +1,71 @@
 # src/deployer.py
+import codecs
+import os
+import selectors
 import subprocess
+import time
 import structlog
-from src.intelligent_config import IntelligentConfig
+from src.intelligent_config import get_config, intelligent_config
 from typing import Optional
 
 log = structlog.get_logger()
 
+HEAL_TTL_SECONDS = 600
+_last_heal: Optional[float] = None
+
+class _LineBatcher:
+    """Buffer subprocess output lines and log them as one record per batch."""
+
+    def __init__(self, logger, max_lines: int = 64, max_ms: int = 50):
+        self.log = logger
+        self.max_lines = max_lines
+        self.max_ns = max_ms * 1_000_000
+        self.lines: list[str] = []
+        self.first_ns = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+        return False
+
+    def add(self, line: str):
+        if not self.lines:
+            self.first_ns = time.monotonic_ns()
+        self.lines.append(line)
+        if len(self.lines) >= self.max_lines:
+            self.flush()
+
+    def timeout(self) -> Optional[float]:
+        """Seconds until the pending batch is due, or None when nothing is buffered."""
+        if not self.lines:
+            return None
+        return max(0.0, (self.first_ns + self.max_ns - time.monotonic_ns()) / 1e9)
+
+    def flush_if_due(self):
+        if self.lines and time.monotonic_ns() - self.first_ns >= self.max_ns:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            self.log.info("Subprocess output", source="subprocess", lines=self.lines)
+            self.lines = []
+
 class Deployer:
     """Handles application deployment to various targets."""
 
     def __init__(self):
         """Initialize the deployer with intelligent configuration."""
-        self.intelligent_config = IntelligentConfig()
-        self.config = self.intelligent_config.get_dynamic_config()
+        self.intelligent_config = intelligent_config
+        self.config = get_config()
         self.project_name = self.config.get("project", {}).get("name", "omnitide-ai-suite")
         self.log = structlog.get_logger(deployer=self.__class__.__name__)
+        self._DISPATCH = {
+            "docker": self.deploy_docker,
+            "local": self.deploy_local,
+            "k8s": self.deploy_kubernetes,
+        }
 
     def _run_command(self, command: list[str]):
         """Run a shell command and log the output."""
@@ -25,14 +76,32 @@ class Deployer:
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                encoding='utf-8'
+                bufsize=0
             )
             
-            # Stream output to logs
+            # Stream output to logs, reading the pipe in 64 KiB chunks and
+            # emitting lines in batches of up to 64 lines or 50 ms
             if process.stdout:
-                for line in iter(process.stdout.readline, ''):
-                    self.log.info(line.strip(), source="subprocess")
+                fd = process.stdout.fileno()
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                pending = ""
+                with selectors.DefaultSelector() as selector, _LineBatcher(self.log) as batcher:
+                    selector.register(fd, selectors.EVENT_READ)
+                    while True:
+                        if not selector.select(batcher.timeout()):
+                            batcher.flush()
+                            continue
+                        chunk = os.read(fd, 65536)
+                        if not chunk:
+                            break
+                        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+                        for line in lines:
+                            batcher.add(line.strip())
+                        batcher.flush_if_due()
+                    pending += decoder.decode(b"", final=True)
+                    if pending:
+                        batcher.add(pending.strip())
+                process.stdout.close()
             
             process.wait()
             
@@ -53,32 +122,40 @@ class Deployer:
             self.log.error("An error occurred during command execution", error=str(e))
             raise
 
-    def deploy(self, target: str = "docker", port: Optional[int] = None):
+    def _heal(self):
+        """Run pre-deployment healing at most once per HEAL_TTL_SECONDS."""
+        global _last_heal
+        now = time.monotonic()
+        if _last_heal is not None and now - _last_heal < HEAL_TTL_SECONDS:
+            return
+        self.log.info("Running pre-deployment healing...")
+        healing_actions = self.intelligent_config.heal_project()
+        for action in healing_actions:
+            self.log.info(action, source="heal_project")
+        _last_heal = now
+
+    def deploy(self, target: str = "docker", port: Optional[int] = None, skip_heal: bool = False):
         """
         Deploy the application to the specified target.
 
         Args:
             target (str): The deployment target ('docker', 'local', 'k8s').
             port (int, optional): The port to expose. Defaults to config.
+            skip_heal (bool): Skip pre-deployment healing.
         """
         self.log.info("Starting deployment", target=target)
-        
-        # Pre-deployment healing
-        self.log.info("Running pre-deployment healing...")
-        healing_actions = self.intelligent_config.heal_project()
-        for action in healing_actions:
-            self.log.info(action, source="heal_project")
 
-        if target == "docker":
-            self.deploy_docker(port)
-        elif target == "local":
-            self.deploy_local(port)
-        elif target == "k8s":
-            self.deploy_kubernetes()
-        else:
+        deploy_target = self._DISPATCH.get(target)
+        if deploy_target is None:
             self.log.error("Unknown deployment target", target=target)
             raise ValueError(f"Unknown deployment target: {target}")
 
+        # Pre-deployment healing
+        if not skip_heal:
+            self._heal()
+
+        deploy_target(port)
+
     def deploy_docker(self, port: Optional[int] = None):
         """Build and run the application as a Docker container."""
         self.log.info("Starting Docker deployment...")
@@ -117,7 +194,7 @@ class Deployer:
         ]
         self._run_command(command)
 
-    def deploy_kubernetes(self):
+    def deploy_kubernetes(self, port: Optional[int] = None):
         """Placeholder for Kubernetes deployment."""
         self.log.warning("Kubernetes deployment is not yet implemented.")
         # Example of what it might look like:
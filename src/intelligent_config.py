@@ -3,133 +3,325 @@ import os
 import sys
 import subprocess
 import importlib
+import importlib.util
 import json
+import functools
+import hashlib
+import pickle
+import re
+import shutil
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 import logging
 
-# Ensure torch is optional
-try:
-    import torch
-except ImportError:
-    torch = None
+__all__ = [
+    "IntelligentConfig",
+    "check_torch_cuda",
+    "detect_env",
+    "get_config",
+    "get_instance",
+    "heal_project",
+]
+
+# Heavy optional modules are imported on first use and memoized here
+_MODULES: Dict[str, Any] = {}
+
+def _lazy_import(name: str):
+    """Import a module on first use; returns None if it is not installed."""
+    if name not in _MODULES:
+        try:
+            _MODULES[name] = importlib.import_module(name)
+        except ImportError:
+            _MODULES[name] = None
+    return _MODULES[name]
+
+_torch_cuda: Optional[bool] = None
 
-# Finalize `torch` handling and ensure consistent return type
 # Ensure `torch` is explicitly checked before accessing `cuda`
-if torch is not None:
-    def check_torch_cuda() -> bool:
+def check_torch_cuda() -> bool:
+    """Whether torch reports a usable CUDA device (computed once per process)."""
+    global _torch_cuda
+    if _torch_cuda is None:
+        # find_spec only consults import metadata, so a missing torch costs no import attempt
+        torch = _lazy_import("torch") if importlib.util.find_spec("torch") is not None else None
         cuda_available = getattr(torch, 'cuda', None)
-        return bool(cuda_available and cuda_available.is_available())
-else:
-    def check_torch_cuda() -> bool:
-        return False
+        _torch_cuda = bool(cuda_available and cuda_available.is_available())
+    return _torch_cuda
+
+OLLAMA_API_BASE = "http://localhost:11434"
+
+# First column of each `ollama list` row, skipping the NAME header
+_OLLAMA_MODEL_RE = re.compile(rb'(?m)^(?!NAME\b)(\S+)')
+
+_FALLBACK_SAMPLE_CSV = b"feature_1,feature_2,feature_3,target\n0.1,0.2,0.3,1\n0.4,0.5,0.6,0\n0.7,0.8,0.9,1\n"
+
+# Probe results older than this are served stale while refreshed in the background
+ENV_CACHE_TTL = 3600  # seconds
+# How long the dynamic config and environment are reused (OMNITIDE_CONFIG_TTL overrides)
+CONFIG_MEMO_SECONDS = float(os.environ.get("OMNITIDE_CONFIG_TTL", "60"))
 
 class IntelligentConfig:
     """Dynamic configuration system that adapts to environment and handles dependencies."""
+
+    # Static sections shared by every generated config; treat as read-only
+    _STATIC_CONFIG: Dict[str, Any] = {
+        "project": {
+            "name": "omnitide-ai-suite",
+            "version": "1.0.0",
+            "description": "Dynamic MLOps & LLM Platform"
+        },
+    }
+    _STATIC_DATA_CONFIG: Dict[str, Any] = {
+        "sample_size": 1000,
+        "validation_split": 0.2,
+        "test_split": 0.1
+    }
     
     def __init__(self):
         self.base_path = Path(__file__).parent.parent
         self.config_cache = {}
         self.available_modules = {}
+        self._disk_cache: Optional[Dict[str, Any]] = None
+        self._cache_lock = threading.Lock()
+        self._refreshing: set = set()
+        self._gpu_cached: Optional[bool] = None
+        self._ollama_model: Optional[str] = None
+        self._search_path = os.environ.get("PATH", os.defpath)
+        # Base path whose standard directories are known to exist (.dirs_ok sentinel)
+        self._dirs_ready_for: Optional[Path] = None
+        self._paths_base: Optional[Path] = self.base_path
+        self._paths_template = self._build_paths_template()
         self.setup_logging()
         
     def setup_logging(self):
-        """Setup intelligent logging that works with or without structlog."""
-        try:
-            import structlog
+        """Defer logger creation (and the structlog import) to the first log call."""
+        self.logger = None
+        self.use_structlog = False
+        self.log_info = self._first_log_info
+
+    def _first_log_info(self, message: str, **kwargs):
+        self._init_logger()
+        self.log_info(message, **kwargs)
+
+    def _init_logger(self):
+        """Setup intelligent logging and bind ``log_info`` to the chosen logger."""
+        structlog = _lazy_import("structlog")
+        if structlog is not None:
             self.logger = structlog.get_logger()
             self.use_structlog = True
-        except ImportError:
+            self.log_info = self.logger.info
+        else:
             logging.basicConfig(level=logging.INFO)
             self.logger = logging.getLogger(__name__)
             self.use_structlog = False
+            logger = self.logger
+            # %-style arguments are only formatted when INFO is enabled
+            self.log_info = lambda message, **kwargs: logger.info("%s %s", message, kwargs)
     
-    def log_info(self, message: str, **kwargs):
-        """Intelligent logging that adapts to available logger."""
-        if self.use_structlog:
-            self.logger.info(message, **kwargs)
-        else:
-            self.logger.info(f"{message} {kwargs}")
-    
+    def _cache_file(self) -> Path:
+        """Probe cache path, scoped to the current interpreter, PATH and venv."""
+        return self.base_path / ".cache" / f"env-{_probe_env_key()}.json"
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the on-disk probe cache once per instance."""
+        if self._disk_cache is None:
+            try:
+                with open(self._cache_file(), encoding="utf-8") as f:
+                    self._disk_cache = json.load(f)
+            except (OSError, ValueError):
+                self._disk_cache = {}
+        return self._disk_cache
+
+    def _save_cache(self):
+        """Atomically rewrite the on-disk probe cache."""
+        cache_file = self._cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self._disk_cache, f)
+        os.replace(tmp_file, cache_file)
+
+    def _store_probe(self, key: str, value: Any):
+        with self._cache_lock:
+            self._load_cache()[key] = {"ts": time.time(), "value": value}
+            try:
+                self._save_cache()
+            except OSError:
+                pass
+
+    def _refresh_probe(self, key: str, probe: Callable[[], Any]):
+        """Re-run a stale probe on a background thread."""
+        with self._cache_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._store_probe(key, probe())
+            finally:
+                with self._cache_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _cached_probe(self, key: str, probe: Callable[[], Any]) -> Any:
+        """Serve a probe result from the disk cache (stale-while-revalidate)."""
+        with self._cache_lock:
+            entry = self._load_cache().get(key)
+        if entry is not None:
+            if time.time() - entry["ts"] >= ENV_CACHE_TTL:
+                self._refresh_probe(key, probe)
+            return entry["value"]
+        value = probe()
+        self._store_probe(key, value)
+        return value
+
+    def _memoized(self, name: str, build: Callable[[], Any]) -> Any:
+        """Return a value memoized for CONFIG_MEMO_SECONDS per base path."""
+        base, now = str(self.base_path), time.monotonic()
+        entry = self.config_cache.get(name)
+        if entry is not None and entry[0] == base and now < entry[1]:
+            return entry[2]
+        value = build()
+        self.config_cache[name] = (base, now + CONFIG_MEMO_SECONDS, value)
+        return value
+
+    def invalidate(self):
+        """Forget the memoized config and environment so they are rebuilt."""
+        self.config_cache.clear()
+        _reset_config_snapshot()
+
+    def invalidate_caches(self):
+        """Drop in-memory and on-disk probe results."""
+        self.invalidate()
+        self._gpu_cached = None
+        self._ollama_model = None
+        with self._cache_lock:
+            self._disk_cache = {}
+            self.available_modules.clear()
+            try:
+                self._cache_file().unlink()
+            except OSError:
+                pass
+
     def check_module_availability(self, module_name: str) -> bool:
         """Check if a module is available and cache the result."""
         if module_name in self.available_modules:
             return self.available_modules[module_name]
         
-        try:
-            importlib.import_module(module_name)
-            self.available_modules[module_name] = True
+        available = self._cached_probe(f"module:{module_name}", lambda: self._probe_module(module_name))
+        self.available_modules[module_name] = available
+        return available
+
+    def _probe_module(self, module_name: str) -> bool:
+        # Locate the module without executing it (importing torch takes seconds)
+        if module_name in sys.modules:
             return True
-        except ImportError:
-            self.available_modules[module_name] = False
+        try:
+            return importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
             return False
 
-    def check_command_availability(self, command: str) -> bool:
-        """Check if a command line tool is available."""
+    def check_command_availability(self, command: str, probe_version: bool = False) -> bool:
+        """Check if a command line tool is available.
+
+        By default this only resolves the command on PATH; pass
+        ``probe_version=True`` to also require ``<command> --version`` to succeed.
+        """
+        if not probe_version:
+            return self._cached_probe(f"cmd:{command}", lambda: self._probe_command(command))
+        return self._cached_probe(f"cmd_version:{command}", lambda: self._probe_command_version(command))
+
+    def _probe_command(self, command: str) -> bool:
+        return shutil.which(command, path=self._search_path) is not None
+
+    def _probe_command_version(self, command: str) -> bool:
+        # `--version` exits immediately once the binary is known to exist, so
+        # skip the timeout machinery (kept only for nvidia-smi and ollama)
+        executable = shutil.which(command, path=self._search_path)
+        if executable is None:
+            return False
         try:
-            subprocess.run([command, "--version"], 
-                         capture_output=True, 
-                         check=True, 
-                         timeout=5)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            process = subprocess.Popen([executable, "--version"],
+                                       stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.DEVNULL)
+            return process.wait() == 0
+        except OSError:
             return False
 
     def get_dynamic_config(self) -> Dict[str, Any]:
-        """Generate dynamic configuration based on environment."""
+        """Generate dynamic configuration based on environment (memoized per minute)."""
+        return self._memoized("dynamic_config", self._build_dynamic_config)
+
+    def _build_dynamic_config(self) -> Dict[str, Any]:
         env_info = self.detect_environment()
         
-        config = {
-            "project": {
-                "name": "omnitide-ai-suite",
-                "version": "1.0.0",
-                "description": "Dynamic MLOps & LLM Platform"
-            },
-            "api": {
-                "host": "0.0.0.0",
-                "port": env_info.get("available_ports", [8000])[0],
-                "reload": env_info.get("dev_mode", True)
-            },
-            "paths": self.get_dynamic_paths(),
-            "data": self.get_data_config(),
-            "models": self.get_model_config(),
-            "llm": self.get_llm_config(),
-            "monitoring": self.get_monitoring_config(),
-            "environment": env_info
+        # Overlay the dynamic sections on the static template
+        config = {**self._STATIC_CONFIG}
+        config["api"] = {
+            "host": "0.0.0.0",
+            "port": env_info.get("available_ports", [8000])[0],
+            "reload": env_info.get("dev_mode", True)
         }
+        config["paths"] = self.get_dynamic_paths()
+        config["data"] = self.get_data_config()
+        config["models"] = self.get_model_config()
+        config["llm"] = self.get_llm_config()
+        config["monitoring"] = self.get_monitoring_config()
+        config["environment"] = env_info
         
         return config
 
+    def _build_paths_template(self) -> Dict[str, str]:
+        base = os.fspath(self.base_path)
+        return {
+            "base": base,
+            "data_dir": os.path.join(base, "data"),
+            "models_dir": os.path.join(base, "models"),
+            "reports_dir": os.path.join(base, "reports"),
+            "logs_dir": os.path.join(base, "logs"),
+            "config_file": os.path.join(base, "config.yaml")
+        }
+
     def get_dynamic_paths(self) -> Dict[str, str]:
-        """Get dynamic paths based on current environment."""
+        """Get dynamic paths based on current environment.
+
+        The returned dict is shared between calls; treat it as read-only.
+        """
         base = self.base_path
+        if self._paths_base != base:
+            self._paths_template = self._build_paths_template()
+            self._paths_base = base
+        paths = self._paths_template
         
-        paths = {
-            "base": str(base),
-            "data_dir": str(base / "data"),
-            "models_dir": str(base / "models"),
-            "reports_dir": str(base / "reports"),
-            "logs_dir": str(base / "logs"),
-            "config_file": str(base / "config.yaml")
-        }
-        
-        # Create directories if they don't exist
-        for key, path in paths.items():
-            if key != "config_file" and key != "base":
-                Path(path).mkdir(exist_ok=True)
+        # Create directories once per base path; the sentinel skips this on later runs
+        # unless one of the directories has since been removed
+        if self._dirs_ready_for != base:
+            sentinel = base / ".dirs_ok"
+            dirs = [paths[key] for key in ("data_dir", "models_dir", "reports_dir", "logs_dir")]
+            if not (sentinel.exists() and all(map(os.path.isdir, dirs))):
+                for path in dirs:
+                    os.makedirs(path, exist_ok=True)
+                sentinel.touch()
+            self._dirs_ready_for = base
                 
         return paths
 
     def get_data_config(self) -> Dict[str, Any]:
         """Get data configuration with fallbacks."""
-        data_path = self.base_path / "data"
+        data_path = os.path.join(self.base_path, "data")
         
         return {
-            "raw_data": str(data_path / "raw"),
-            "processed_data": str(data_path / "processed"),
-            "sample_size": 1000,
-            "validation_split": 0.2,
-            "test_split": 0.1
+            "raw_data": os.path.join(data_path, "raw"),
+            "processed_data": os.path.join(data_path, "processed"),
+            **self._STATIC_DATA_CONFIG
         }
 
     def get_model_config(self) -> Dict[str, Any]:
@@ -159,7 +351,9 @@ class IntelligentConfig:
             "enabled": has_ollama,
             "provider": "ollama" if has_ollama else "none",
             "model": available_model,
-            "api_base": "http://localhost:11434",
+            "api_base": OLLAMA_API_BASE,
+            # Match the server's OLLAMA_NUM_PARALLEL so clients don't over-queue it
+            "num_parallel": int(os.environ.get("OLLAMA_NUM_PARALLEL", "4")),
             "temperature": 0.7,
             "max_tokens": 2000
         }
@@ -171,31 +365,42 @@ class IntelligentConfig:
 
     def detect_available_ollama_model(self) -> str:
         """Detect which Ollama model is available."""
+        if self._ollama_model is None:
+            self._ollama_model = self._cached_probe("ollama_model", self._probe_ollama_model)
+        return self._ollama_model
+
+    def _list_ollama_models(self) -> Optional[List[str]]:
+        """Installed Ollama model names, from the HTTP API or the CLI as fallback."""
+        try:
+            with urllib.request.urlopen(f"{OLLAMA_API_BASE}/api/tags", timeout=2) as response:
+                return [model["name"] for model in json.loads(response.read()).get("models", [])]
+        except urllib.error.URLError as e:
+            if not isinstance(e.reason, ConnectionRefusedError):
+                return None
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # The API refused the connection; fall back to the CLI
         try:
             result = subprocess.run(["ollama", "list"], 
                                   capture_output=True, 
-                                  text=True, 
                                   timeout=5)
             if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) > 1:  # Skip header line
-                    # Get the first available model
-                    first_model = lines[1].split()[0] if lines[1].split() else "phi3:mini"
-                    return first_model
+                return [name.decode() for name in _OLLAMA_MODEL_RE.findall(result.stdout)]
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
             pass
-        
+        return None
+
+    def _probe_ollama_model(self) -> str:
         # Default fallback models in order of preference
         fallback_models = ["phi3:mini", "llama3.2:3b", "llama3.1:8b", "mistral:7b"]
-        for model in fallback_models:
-            try:
-                result = subprocess.run(["ollama", "show", model], 
-                                      capture_output=True, 
-                                      timeout=3)
-                if result.returncode == 0:
+        installed = self._list_ollama_models()
+        if installed:
+            installed_set = set(installed)
+            for model in fallback_models:
+                if model in installed_set:
                     return model
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                continue
+            return installed[0]
                 
         return "phi3:mini"  # Ultimate fallback
 
@@ -212,93 +417,142 @@ class IntelligentConfig:
 
     def detect_gpu_availability(self) -> bool:
         """Detect if GPU is available for ML tasks."""
-        try:
-            # Check for NVIDIA GPU
-            result = subprocess.run(["nvidia-smi"], 
-                                  capture_output=True, 
-                                  check=True, 
-                                  timeout=5)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+        # Called by both detect_environment and get_model_config per config build
+        if self._gpu_cached is None:
+            self._gpu_cached = self._cached_probe("gpu", self._probe_gpu)
+        return self._gpu_cached
+
+    def _probe_gpu(self) -> bool:
+        # Check for NVIDIA GPU, spawning nvidia-smi only when it is installed
+        if shutil.which("nvidia-smi", path=self._search_path) is not None:
+            try:
+                subprocess.run(["nvidia-smi"], 
+                             capture_output=True, 
+                             check=True, 
+                             timeout=5)
+                return True
+            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+                pass
             
         # Check for other GPU types (AMD, Intel)
-        try:
-            return check_torch_cuda()
-        except ImportError:
-            pass
-            
-        return False
+        return check_torch_cuda()
 
     def detect_environment(self) -> Dict[str, Any]:
-        """Detect current environment and capabilities."""
+        """Detect current environment and capabilities (memoized for CONFIG_MEMO_SECONDS)."""
+        return self._memoized("environment", self._build_environment)
+
+    def _build_environment(self) -> Dict[str, Any]:
+        tools = ["git", "docker", "ollama", "dvc"]
+        packages = ["fastapi", "pandas", "sklearn", "torch", "tensorflow"]
+        probes: Dict[str, Callable[[], Any]] = {
+            "has_gpu": self.detect_gpu_availability,
+            "available_ports": self.get_available_ports,
+        }
+        # Check for important tools and Python packages
+        probes.update({f"has_{tool}": functools.partial(self.check_command_availability, tool) for tool in tools})
+        probes.update({f"has_{package}": functools.partial(self.check_module_availability, package) for package in packages})
+        
+        # Probes already on disk are dict lookups; only fan out when some must run
+        with self._cache_lock:
+            cache = self._load_cache()
+            cold = "gpu" not in cache or any(f"cmd:{tool}" not in cache for tool in tools) \
+                or any(f"module:{package}" not in cache for package in packages)
+        if cold:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {name: executor.submit(probe) for name, probe in probes.items()}
+                results = {name: future.result() for name, future in futures.items()}
+        else:
+            results = {name: probe() for name, probe in probes.items()}
+        
         env_info = {
             "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
             "platform": sys.platform,
             "working_directory": str(Path.cwd()),
-            "has_gpu": self.detect_gpu_availability(),
-            "available_ports": self.get_available_ports(),
+            "has_gpu": results.pop("has_gpu"),
+            "available_ports": results.pop("available_ports"),
             "dev_mode": os.getenv("ENVIRONMENT", "development") == "development"
         }
-        
-        # Check for important tools
-        tools = ["git", "docker", "ollama", "dvc"]
-        for tool in tools:
-            env_info[f"has_{tool}"] = self.check_command_availability(tool)
-        
-        # Check for Python packages
-        packages = ["fastapi", "pandas", "sklearn", "torch", "tensorflow"]
-        for package in packages:
-            env_info[f"has_{package}"] = self.check_module_availability(package)
-            
+        env_info.update(results)
         return env_info
 
-    def get_available_ports(self, start_port: int = 8000, num_ports: int = 10) -> List[int]:
-        """Find available ports starting from start_port."""
-        import socket
+    def get_available_ports(self, start_port: int = 8000, num_ports: int = 10,
+                            max_results: Optional[int] = None) -> List[int]:
+        """Find available ports starting from start_port.
+
+        Scanning stops early once ``max_results`` free ports have been found.
+        """
         available_ports = []
         
         for port in range(start_port, start_port + num_ports):
             try:
                 with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                    # Match the servers we launch, which bind with SO_REUSEADDR
+                    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                     s.bind(('localhost', port))
                     available_ports.append(port)
             except OSError:
                 continue
+            if max_results is not None and len(available_ports) >= max_results:
+                break
                 
         return available_ports if available_ports else [start_port]
 
+    def get_first_available_port(self, start_port: int = 8000, num_ports: int = 10) -> int:
+        """Return the first free port, binding as few sockets as possible."""
+        return self.get_available_ports(start_port, num_ports, max_results=1)[0]
+
+    def _fs_snapshot(self) -> Dict[str, set]:
+        """Entry names of the base path and its data directories, one readdir each."""
+        snapshot = {}
+        for rel_dir in ("", "data", "data/raw"):
+            try:
+                with os.scandir(os.path.join(self.base_path, rel_dir)) as entries:
+                    snapshot[rel_dir] = {entry.name for entry in entries}
+            except OSError:
+                snapshot[rel_dir] = set()
+        return snapshot
+
+    @staticmethod
+    def _in_snapshot(snapshot: Dict[str, set], rel_path: str) -> bool:
+        parent, _, name = rel_path.rpartition("/")
+        return name in snapshot.get(parent, ())
+
     def heal_project(self) -> List[str]:
         """Perform project healing and return list of actions taken."""
         actions = []
+        snapshot = self._fs_snapshot()
         
         # Create missing directories
         required_dirs = ["data/raw", "data/processed", "models", "reports", "logs"]
         for dir_path in required_dirs:
-            full_path = self.base_path / dir_path
-            if not full_path.exists():
-                full_path.mkdir(parents=True, exist_ok=True)
+            if not self._in_snapshot(snapshot, dir_path):
+                os.makedirs(os.path.join(self.base_path, dir_path), exist_ok=True)
                 actions.append(f"Created directory: {dir_path}")
         
-        # Install missing critical dependencies
-        critical_deps = ["fastapi", "uvicorn", "pandas", "scikit-learn"]
-        missing_deps = [dep for dep in critical_deps if not self.check_module_availability(dep)]
+        # Install missing critical dependencies (pip name -> import name); find_spec
+        # is checked directly so a stale probe cache never hides a missing package
+        critical_deps = {"fastapi": "fastapi", "uvicorn": "uvicorn", "pandas": "pandas", "scikit-learn": "sklearn"}
+        missing_deps = [dep for dep, module in critical_deps.items() if importlib.util.find_spec(module) is None]
         
-        if missing_deps:
+        if not missing_deps:
+            actions.append("Critical dependencies present")
+        else:
             try:
-                subprocess.run([sys.executable, "-m", "pip", "install"] + missing_deps, 
+                subprocess.run([sys.executable, "-m", "pip", "install", "--no-input",
+                              "--disable-pip-version-check", "--quiet"] + missing_deps, 
                              check=True, capture_output=True)
                 actions.append(f"Installed missing dependencies: {', '.join(missing_deps)}")
+                self.invalidate_caches()
             except subprocess.CalledProcessError as e:
                 actions.append(f"Failed to install dependencies: {e}")
         
         # Create sample data if missing
-        data_file = self.base_path / "data" / "raw" / "data.csv"
-        if not data_file.exists():
+        if not self._in_snapshot(snapshot, "data/raw/data.csv"):
             self.create_sample_data()
             actions.append("Created sample data file")
         
-        # Validate configuration
+        # Validate configuration against the healed project
+        self.invalidate()
         try:
             config = self.get_dynamic_config()
             actions.append("Configuration validated successfully")
@@ -307,40 +561,34 @@ class IntelligentConfig:
         
         return actions
 
-    def create_sample_data(self):
-        """Create sample data for testing."""
-        try:
-            import pandas as pd
-            import numpy as np
-            
-            # Generate sample data
-            np.random.seed(42)
+    def create_sample_data(self) -> str:
+        """Create sample data for testing and return its path."""
+        data_dir = self.base_path / "data" / "raw"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        data_file = data_dir / "data.csv"
+        
+        np = _lazy_import("numpy")
+        if np is not None:
+            # Generate all columns from one RNG and write them without pandas
             n_samples = 1000
-            
-            data = {
-                'feature_1': np.random.normal(0, 1, n_samples),
-                'feature_2': np.random.normal(0, 1, n_samples),
-                'feature_3': np.random.uniform(-1, 1, n_samples),
-                'target': np.random.choice([0, 1], n_samples)
-            }
-            
-            df = pd.DataFrame(data)
-            
-            # Save sample data
-            data_dir = self.base_path / "data" / "raw"
-            data_dir.mkdir(parents=True, exist_ok=True)
-            df.to_csv(data_dir / "data.csv", index=False)
-            
-        except ImportError:
-            # Create basic CSV without pandas
-            data_dir = self.base_path / "data" / "raw"
-            data_dir.mkdir(parents=True, exist_ok=True)
-            
-            with open(data_dir / "data.csv", "w") as f:
-                f.write("feature_1,feature_2,feature_3,target\n")
-                f.write("0.1,0.2,0.3,1\n")
-                f.write("0.4,0.5,0.6,0\n")
-                f.write("0.7,0.8,0.9,1\n")
+            rng = np.random.default_rng(42)
+            data = rng.standard_normal((n_samples, 4))
+            data[:, 2] = rng.uniform(-1, 1, n_samples)
+            data[:, 3] = rng.random(n_samples) < 0.5
+            np.savetxt(
+                data_file, data, delimiter=',',
+                header='feature_1,feature_2,feature_3,target', comments='',
+                fmt=['%.6f', '%.6f', '%.6f', '%d']
+            )
+        else:
+            # Create basic CSV without numpy in a single write
+            fd = os.open(data_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, _FALLBACK_SAMPLE_CSV)
+            finally:
+                os.close(fd)
+        
+        return str(data_file)
 
     def orchestrate_agent_task(self, task_name: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Orchestrate various agent tasks."""
@@ -366,6 +614,8 @@ class IntelligentConfig:
                     if missing_deps:
                         subprocess.run([sys.executable, "-m", "pip", "install"] + missing_deps, 
                                      check=True, capture_output=True)
+                        # Cached has_* probes (also on disk, shared across processes) are now wrong
+                        self.invalidate_caches()
                         return {"success": True, "result": f"Installed: {', '.join(missing_deps)}"}
                     else:
                         return {"success": True, "result": "No dependencies to install"}
@@ -379,18 +629,108 @@ class IntelligentConfig:
             return {"success": False, "error": str(e)}
 
 
-# Global instance for easy access
-intelligent_config = IntelligentConfig()
+# Global instance for easy access, created on first use (PEP 562)
+_intelligent_config: Optional[IntelligentConfig] = None
+
+def get_instance() -> IntelligentConfig:
+    """Return the shared IntelligentConfig, creating it on first use."""
+    global _intelligent_config
+    if _intelligent_config is None:
+        _intelligent_config = IntelligentConfig()
+    return _intelligent_config
+
+def __getattr__(name: str) -> Any:
+    if name == "intelligent_config":
+        return get_instance()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _probe_env_key() -> str:
+    """Hash the interpreter and search paths that probe results depend on."""
+    h = hashlib.blake2b(digest_size=8)
+    for part in (sys.executable, os.environ.get("PATH", ""), os.environ.get("VIRTUAL_ENV", "")):
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+# Config snapshot shared across CLI invocations
+_CONFIG_CACHE_PATH = Path.home() / ".cache" / "omnitide" / "config.pkl"
+_CONFIG_CACHE_TTL = 3600  # seconds
+_CONFIG_CACHE_ENV_VARS = ("ENVIRONMENT", "PATH", "VIRTUAL_ENV", "OLLAMA_NUM_PARALLEL")
+_config_snapshot: Optional[Dict[str, Any]] = None
+
+def _config_cache_key(base_path: Path) -> str:
+    """Hash the inputs that invalidate a cached config snapshot."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(sys.executable.encode())
+    h.update(os.getcwd().encode())
+    for name in ("pyproject.toml", "src/config.py"):
+        try:
+            h.update(str(os.stat(base_path / name).st_mtime_ns).encode())
+        except OSError:
+            h.update(b"-")
+    for var in _CONFIG_CACHE_ENV_VARS:
+        h.update(os.environ.get(var, "").encode())
+    return h.hexdigest()
+
+def _reset_config_snapshot():
+    """Drop the in-process and on-disk config snapshots."""
+    global _config_snapshot
+    _config_snapshot = None
+    try:
+        _CONFIG_CACHE_PATH.unlink()
+    except OSError:
+        pass
+
+def _without_ports(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of config without the port probes, which go stale between runs."""
+    environment = {k: v for k, v in config.get("environment", {}).items() if k != "available_ports"}
+    api = {k: v for k, v in config.get("api", {}).items() if k != "port"}
+    return {**config, "environment": environment, "api": api}
+
+def _with_live_ports(config: Dict[str, Any], instance: IntelligentConfig) -> Dict[str, Any]:
+    """Fill a persisted snapshot's port fields from a fresh probe."""
+    ports = instance.get_available_ports()
+    return {
+        **config,
+        "environment": {**config.get("environment", {}), "available_ports": ports},
+        "api": {**config.get("api", {}), "port": ports[0]},
+    }
 
 # Convenience functions
 def get_config() -> Dict[str, Any]:
-    """Get dynamic configuration"""
-    return intelligent_config.get_dynamic_config()
+    """Get dynamic configuration (memoized in-process and on disk)"""
+    global _config_snapshot
+    if _config_snapshot is not None:
+        return _config_snapshot
+
+    instance = get_instance()
+    key = _config_cache_key(instance.base_path)
+    try:
+        with open(_CONFIG_CACHE_PATH, "rb") as f:
+            cached = pickle.load(f)
+        if cached["key"] == key and time.time() - cached["created"] < _CONFIG_CACHE_TTL:
+            _config_snapshot = _with_live_ports(cached["config"], instance)
+            return _config_snapshot
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError):
+        pass
+
+    config = instance.get_dynamic_config()
+    try:
+        _CONFIG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CONFIG_CACHE_PATH.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"key": key, "created": time.time(), "config": _without_ports(config)}, f)
+        os.replace(tmp_path, _CONFIG_CACHE_PATH)
+    except OSError:
+        pass
+
+    _config_snapshot = config
+    return config
 
 def detect_env() -> Dict[str, Any]:
     """Detect environment"""
-    return intelligent_config.detect_environment()
+    return get_instance().detect_environment()
 
 def heal_project() -> List[str]:
     """Heal project"""
-    return intelligent_config.heal_project()
+    return get_instance().heal_project()
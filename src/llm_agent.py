@@ -1,41 +1,66 @@
 # src/llm_agent.py
+import asyncio
+import functools
+import hashlib
 import json
+import os
+import string
+import httpx
+import pickle
 import requests
+from requests.adapters import HTTPAdapter
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
+from typing import AsyncIterator, Optional
 from .intelligent_config import get_config
 
-def get_ollama_model() -> str:
-    """Get the configured Ollama model from intelligent config."""
+OLLAMA_BASE_URL = "http://localhost:11434"
+REPORTS_DIR = Path("reports")
+DEFAULT_REPORT_PATH = str(REPORTS_DIR / "llm_report_summary.md")
+LLM_OPTIONS = {"temperature": 0.3, "max_tokens": 500}
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# LLM analyses are reused for the same model and metrics (rounded) for up to an hour
+ANALYSIS_CACHE_PATH = Path.home() / ".cache" / "omnitide" / "llm_analysis_cache.pkl"
+ANALYSIS_CACHE_SIZE = 64
+ANALYSIS_CACHE_TTL = 3600  # seconds
+ANALYSIS_CACHE_DIGITS = 2
+REPORT_METRICS = ("accuracy", "precision", "recall", "f1_score")
+
+# Keep-alive connection pool shared by the synchronous Ollama calls
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+@functools.lru_cache(maxsize=1)
+def _cached_dynamic_config() -> dict:
+    """Dynamic config resolved once per process, including when detection fails."""
     try:
-        config = get_config()
-        return config.get("llm", {}).get("model", "phi3:mini")
+        return get_config()
     except Exception:
-        return "phi3:mini"  # Fallback
+        return {}
 
-def generate_llm_report(metrics_path: str = "reports/latest_metrics.json") -> str:
-    """Generate an LLM-powered report from model metrics using Ollama."""
-    
-    try:
-        # Load metrics
-        with open(metrics_path, 'r') as f:
-            metrics = json.load(f)
-        
-        # Get the configured model dynamically
-        model_name = get_ollama_model()
-        
-        # Create prompt for LLM
-        prompt = f"""
+def get_ollama_model() -> str:
+    """Get the configured Ollama model from intelligent config."""
+    return _cached_dynamic_config().get("llm", {}).get("model", "phi3:mini")  # Fallback
+
+def get_ollama_parallelism() -> int:
+    """Number of requests the Ollama server runs concurrently."""
+    return _cached_dynamic_config().get("llm", {}).get(
+        "num_parallel", int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+    )
+
+_PROMPT_TMPL = string.Template("""
         Analyze the following machine learning model performance metrics and provide insights:
         
         Metrics:
-        - Accuracy: {metrics.get('accuracy', 'N/A')}
-        - Precision: {metrics.get('precision', 'N/A')}
-        - Recall: {metrics.get('recall', 'N/A')}
-        - F1 Score: {metrics.get('f1_score', 'N/A')}
+        - Accuracy: $accuracy
+        - Precision: $precision
+        - Recall: $recall
+        - F1 Score: $f1_score
         
-        Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        Generated on: $generated
         
         Please provide:
         1. Overall assessment of model performance
@@ -44,44 +69,34 @@ def generate_llm_report(metrics_path: str = "reports/latest_metrics.json") -> st
         4. Potential business impact
         
         Keep the response concise but informative, suitable for technical stakeholders.
-        """
-        
-        # Call Ollama API
-        ollama_response = requests.post(
-            "http://localhost:11434/api/generate",
-            json={
-                "model": model_name,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.3,
-                    "max_tokens": 500
-                }
-            },
-            timeout=60
-        )
-        
-        if ollama_response.status_code == 200:
-            response_data = ollama_response.json()
-            llm_analysis = response_data.get('response', 'No response generated')
-            
-            # Create comprehensive report
-            report = f"""# 🤖 Omnitide AI Suite - LLM Model Analysis Report
+        """)
 
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+def _build_prompt(metrics: dict, generated: str) -> str:
+    """Build the Ollama analysis prompt for a metrics dict."""
+    return _PROMPT_TMPL.substitute(
+        accuracy=metrics.get('accuracy', 'N/A'),
+        precision=metrics.get('precision', 'N/A'),
+        recall=metrics.get('recall', 'N/A'),
+        f1_score=metrics.get('f1_score', 'N/A'),
+        generated=generated,
+    )
+
+_LLM_REPORT_TMPL = string.Template("""# 🤖 Omnitide AI Suite - LLM Model Analysis Report
+
+Generated: $generated
 
 ## 📊 Performance Metrics Summary
 
 | Metric | Value |
 |--------|-------|
-| Accuracy | {metrics.get('accuracy', 'N/A'):.4f} |
-| Precision | {metrics.get('precision', 'N/A'):.4f} |
-| Recall | {metrics.get('recall', 'N/A'):.4f} |
-| F1 Score | {metrics.get('f1_score', 'N/A'):.4f} |
+| Accuracy | $accuracy |
+| Precision | $precision |
+| Recall | $recall |
+| F1 Score | $f1_score |
 
 ## 🧠 AI-Powered Analysis
 
-{llm_analysis}
+$llm_analysis
 
 ## 🔍 Technical Details
 
@@ -99,16 +114,80 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ---
 *Report generated by Omnitide AI Suite LLM Agent*
-"""
-            
-            # Save report
-            report_path = Path("reports/llm_report_summary.md")
-            report_path.parent.mkdir(exist_ok=True)
-            with open(report_path, 'w') as f:
-                f.write(report)
-            
-            print(f"✅ LLM report generated: {report_path}")
-            return str(report_path)
+""")
+
+def _render_report(llm_analysis: str, metrics: dict, generated: str) -> str:
+    """Render the LLM analysis report for a metrics dict."""
+    return _LLM_REPORT_TMPL.substitute(
+        generated=generated,
+        accuracy=f"{metrics.get('accuracy', 'N/A'):.4f}",
+        precision=f"{metrics.get('precision', 'N/A'):.4f}",
+        recall=f"{metrics.get('recall', 'N/A'):.4f}",
+        f1_score=f"{metrics.get('f1_score', 'N/A'):.4f}",
+        llm_analysis=llm_analysis,
+    )
+
+def _write_report(path: str, llm_analysis: str, metrics: dict, generated: str) -> str:
+    """Render the LLM analysis report for a metrics dict and save it to path."""
+    report = _render_report(llm_analysis, metrics, generated)
+    
+    report_path = Path(path)
+    report_path.parent.mkdir(exist_ok=True)
+    with open(report_path, 'w') as f:
+        f.write(report)
+    
+    print(f"✅ LLM report generated: {report_path}")
+    return str(report_path)
+
+def _report_path_for(metrics_path: str) -> str:
+    """Per-metrics-file report location used by batch generation."""
+    return str(REPORTS_DIR / f"llm_report_{Path(metrics_path).stem}.md")
+
+@functools.lru_cache(maxsize=32)
+def _load_metrics(path: str, mtime: float) -> dict:
+    """Parse a metrics file; mtime is part of the key so rewrites are picked up."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def _read_metrics(metrics_path: str) -> dict:
+    return _load_metrics(metrics_path, os.path.getmtime(metrics_path))
+
+def generate_llm_report(metrics_path: str = "reports/latest_metrics.json") -> str:
+    """Generate an LLM-powered report from model metrics using Ollama."""
+    
+    try:
+        # Load metrics
+        metrics = _read_metrics(metrics_path)
+        generated = time.strftime(TIMESTAMP_FORMAT)
+        
+        # Reuse a recent analysis of the same metrics from the same model
+        model = get_ollama_model()
+        key = _ANALYSIS_CACHE.key(model, metrics)
+        llm_analysis = _ANALYSIS_CACHE.get(key)
+        if llm_analysis is not None:
+            return _write_report(DEFAULT_REPORT_PATH, llm_analysis, metrics, generated)
+        
+        # Call Ollama API with the dynamically configured model
+        ollama_response = _SESSION.post(
+            f"{OLLAMA_BASE_URL}/api/generate",
+            json={
+                "model": model,
+                "prompt": _build_prompt(metrics, generated),
+                "stream": True,
+                "options": LLM_OPTIONS
+            },
+            timeout=60,
+            stream=True
+        )
+        
+        if ollama_response.status_code == 200:
+            # Collect tokens as they are decoded rather than waiting for the full body
+            chunks = [json.loads(line).get('response', '') for line in ollama_response.iter_lines() if line]
+            llm_analysis = ''.join(chunks)
+            if llm_analysis:
+                _ANALYSIS_CACHE.put(key, llm_analysis)
+            llm_analysis = llm_analysis or 'No response generated'
+            return _write_report(DEFAULT_REPORT_PATH, llm_analysis, metrics, generated)
             
         else:
             raise Exception(f"Ollama API error: {ollama_response.status_code}")
@@ -122,61 +201,57 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         print(f"❌ Error generating LLM report: {e}")
         return generate_fallback_report(metrics_path)
 
-def generate_fallback_report(metrics_path: str) -> str:
+def generate_fallback_report(metrics_path: str, report_path: str = DEFAULT_REPORT_PATH) -> str:
     """Generate a comprehensive report without LLM when Ollama is unavailable."""
     
     try:
-        with open(metrics_path, 'r') as f:
-            metrics = json.load(f)
+        metrics = _read_metrics(metrics_path)
     except:
         metrics = {"accuracy": 0.0, "precision": 0.0, "recall": 0.0, "f1_score": 0.0}
     
-    # Analyze metrics programmatically
-    accuracy = float(metrics.get('accuracy', 0))
-    precision = float(metrics.get('precision', 0))
-    recall = float(metrics.get('recall', 0))
-    f1 = float(metrics.get('f1_score', 0))
-    
-    # Generate insights based on metrics
-    if accuracy > 0.9:
-        performance_level = "Excellent"
-        performance_color = "🟢"
-    elif accuracy > 0.8:
-        performance_level = "Good"
-        performance_color = "🟡"
-    elif accuracy > 0.7:
-        performance_level = "Fair"
-        performance_color = "🟠"
-    else:
-        performance_level = "Needs Improvement"
-        performance_color = "🔴"
+    # Skip rendering and writing when the existing report was built from these exact metrics
+    report_path = Path(report_path)
+    metrics_hash = hashlib.blake2b(json.dumps(metrics, sort_keys=True).encode(), digest_size=8).hexdigest()
+    hash_line = f"<!-- metrics-hash: {metrics_hash} -->\n"
+    try:
+        with open(report_path, 'r') as f:
+            if f.readline() == hash_line:
+                print(f"✅ Intelligent report up to date: {report_path}")
+                return str(report_path)
+    except (OSError, UnicodeDecodeError):
+        pass
     
-    # Generate recommendations
-    recommendations = []
-    if precision < recall:
-        recommendations.append("• Consider adjusting classification threshold to improve precision")
-    if recall < precision:
-        recommendations.append("• Focus on reducing false negatives to improve recall")
-    if f1 < 0.8:
-        recommendations.append("• Investigate feature engineering opportunities")
-        recommendations.append("• Consider ensemble methods or hyperparameter tuning")
+    report = hash_line + _FALLBACK_HEADER_TMPL.substitute(
+        generated=time.strftime(TIMESTAMP_FORMAT)
+    ) + _fallback_body(
+        float(metrics.get('accuracy', 0)),
+        float(metrics.get('precision', 0)),
+        float(metrics.get('recall', 0)),
+        float(metrics.get('f1_score', 0)),
+    )
     
-    if not recommendations:
-        recommendations.append("• Model performance is balanced, consider deployment")
-        recommendations.append("• Monitor for data drift in production")
+    # Save report
+    report_path.parent.mkdir(exist_ok=True)
+    with open(report_path, 'w') as f:
+        f.write(report)
     
-    report = f"""# 📊 Omnitide AI Suite - Model Performance Report
+    print(f"✅ Intelligent report generated: {report_path}")
+    return str(report_path)
+
+_FALLBACK_HEADER_TMPL = string.Template("""# 📊 Omnitide AI Suite - Model Performance Report
+
+Generated: $generated
 
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+""")
 
-## 🏆 Overall Performance: {performance_color} {performance_level}
+_FALLBACK_TMPL = string.Template("""## 🏆 Overall Performance: $performance_color $performance_level
 
 | Metric | Value | Status |
 |--------|-------|--------|
-| **Accuracy** | {accuracy:.4f} | {'✅' if accuracy > 0.8 else '⚠️'} |
-| **Precision** | {precision:.4f} | {'✅' if precision > 0.8 else '⚠️'} |
-| **Recall** | {recall:.4f} | {'✅' if recall > 0.8 else '⚠️'} |
-| **F1 Score** | {f1:.4f} | {'✅' if f1 > 0.8 else '⚠️'} |
+| **Accuracy** | $accuracy | $accuracy_status |
+| **Precision** | $precision | $precision_status |
+| **Recall** | $recall | $recall_status |
+| **F1 Score** | $f1 | $f1_status |
 
 ## 🔍 Analysis
 
@@ -186,7 +261,7 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 - Automated pipeline is functioning correctly
 
 ### Areas for Improvement
-{chr(10).join(recommendations)}
+$recommendations
 
 ## 🚀 Production Readiness
 
@@ -204,16 +279,99 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ---
 *Generated by Omnitide AI Suite Intelligent Reporting System*
-"""
+""")
+
+# (accuracy floor, level, color), checked in order
+_PERFORMANCE_TIERS = (
+    (0.9, "Excellent", "🟢"),
+    (0.8, "Good", "🟡"),
+    (0.7, "Fair", "🟠"),
+)
+
+_BALANCED_RECOMMENDATIONS = (
+    "• Model performance is balanced, consider deployment",
+    "• Monitor for data drift in production",
+)
+
+@functools.lru_cache(maxsize=32)
+def _fallback_body(accuracy: float, precision: float, recall: float, f1: float) -> str:
+    """Render the metrics-dependent part of the fallback report; identical metrics reuse it."""
+    performance_level, performance_color = next(
+        ((level, color) for floor, level, color in _PERFORMANCE_TIERS if accuracy > floor),
+        ("Needs Improvement", "🔴"),
+    )
     
-    # Save report
-    report_path = Path("reports/llm_report_summary.md")
-    report_path.parent.mkdir(exist_ok=True)
-    with open(report_path, 'w') as f:
-        f.write(report)
+    recommendations = [text for applies, text in (
+        (precision < recall, "• Consider adjusting classification threshold to improve precision"),
+        (recall < precision, "• Focus on reducing false negatives to improve recall"),
+        (f1 < 0.8, "• Investigate feature engineering opportunities"),
+        (f1 < 0.8, "• Consider ensemble methods or hyperparameter tuning"),
+    ) if applies] or _BALANCED_RECOMMENDATIONS
     
-    print(f"✅ Intelligent report generated: {report_path}")
-    return str(report_path)
+    return _FALLBACK_TMPL.substitute(
+        performance_color=performance_color,
+        performance_level=performance_level,
+        accuracy=f"{accuracy:.4f}",
+        precision=f"{precision:.4f}",
+        recall=f"{recall:.4f}",
+        f1=f"{f1:.4f}",
+        accuracy_status='✅' if accuracy > 0.8 else '⚠️',
+        precision_status='✅' if precision > 0.8 else '⚠️',
+        recall_status='✅' if recall > 0.8 else '⚠️',
+        f1_status='✅' if f1 > 0.8 else '⚠️',
+        recommendations='\n'.join(recommendations),
+    )
+
+class _AnalysisCache:
+    """Recent LLM analyses keyed by model and rounded metrics, persisted between runs."""
+
+    def __init__(self, path: Path, size: int = ANALYSIS_CACHE_SIZE, ttl: float = ANALYSIS_CACHE_TTL):
+        self.path = path
+        self.size = size
+        self.ttl = ttl
+        self._entries: Optional[dict] = None
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.path, "rb") as f:
+                    self._entries = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                self._entries = {}
+        return self._entries
+
+    @staticmethod
+    def key(model: str, metrics: dict) -> tuple:
+        """Model plus the prompt's metric values; the timestamp is deliberately left out."""
+        values = []
+        for name in REPORT_METRICS:
+            value = metrics.get(name, 'N/A')
+            values.append(round(value, ANALYSIS_CACHE_DIGITS) if isinstance(value, (int, float)) else repr(value))
+        return (model, *values)
+
+    def get(self, key: tuple) -> Optional[str]:
+        entry = self._load().get(key)
+        if entry is not None and time.time() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def put(self, key: tuple, response: str):
+        entries = self._load()
+        entries.pop(key, None)
+        entries[key] = (time.time(), response)
+        # Dicts keep insertion order, so the first keys are the oldest
+        for stale in list(entries)[:-self.size]:
+            del entries[stale]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
+
+_ANALYSIS_CACHE = _AnalysisCache(ANALYSIS_CACHE_PATH)
 
 class LLMAgent:
     """Advanced LLM Agent for generating intelligent reports and analysis."""
@@ -225,26 +383,101 @@ class LLMAgent:
                 "metrics_filename": "latest_metrics.json"
             }
         }
-        
-    def run_ollama(self, prompt: str) -> str:
-        """Run Ollama inference with the given prompt."""
+        # Shared keep-alive client and in-flight limit, created on first use inside the running loop
+        self._client: Optional[httpx.AsyncClient] = None
+        self._limit: Optional[asyncio.Semaphore] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=OLLAMA_BASE_URL, timeout=300)
+        return self._client
+
+    def _get_limit(self) -> asyncio.Semaphore:
+        if self._limit is None:
+            self._limit = asyncio.Semaphore(get_ollama_parallelism())
+        return self._limit
+
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        self._limit = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def astream_ollama(self, prompt: str, model: Optional[str] = None,
+                             options: Optional[dict] = None) -> AsyncIterator[str]:
+        """Yield Ollama response tokens as they are generated."""
+        payload = {"model": model or get_ollama_model(), "prompt": prompt, "stream": True}
+        if options:
+            payload["options"] = options
+        # Stay within the server's parallel capacity instead of piling onto its queue
+        async with self._get_limit():
+            async with self._get_client().stream("POST", "/api/generate", json=payload) as response:
+                if response.status_code != 200:
+                    raise RuntimeError(f"Error: HTTP {response.status_code}")
+                async for line in response.aiter_lines():
+                    if line:
+                        yield json.loads(line).get('response', '')
+
+    async def _agenerate(self, prompt: str, model: Optional[str] = None,
+                         options: Optional[dict] = None) -> str:
+        chunks = [chunk async for chunk in self.astream_ollama(prompt, model, options)]
+        return ''.join(chunks)
+
+    async def arun_ollama(self, prompt: str, model: Optional[str] = None) -> str:
+        """Run Ollama inference with the given prompt over the async HTTP API."""
         try:
-            model_name = get_ollama_model()
-            response = requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": model_name,
-                    "prompt": prompt,
-                    "stream": False
-                },
-                timeout=30
-            )
-            if response.status_code == 200:
-                return response.json().get('response', 'No response')
-            else:
-                return f"Error: HTTP {response.status_code}"
+            return await self._agenerate(prompt, model) or 'No response'
+        except RuntimeError as e:
+            return str(e)
         except Exception as e:
             return f"Error connecting to Ollama: {e}"
+
+    def run_ollama(self, prompt: str, model: Optional[str] = None) -> str:
+        """Run Ollama inference with the given prompt (sync wrapper for legacy callers)."""
+        async def run_once() -> str:
+            try:
+                return await self.arun_ollama(prompt, model)
+            finally:
+                # The client is bound to this short-lived event loop
+                await self.aclose()
+
+        return asyncio.run(run_once())
+
+    async def generate_reports(self, metrics_paths: list[str],
+                               report_paths: Optional[list[str]] = None) -> list[str]:
+        """Generate one report per metrics file, querying Ollama concurrently.
+
+        Reports go to ``report_paths`` when given, else next to each metrics file's stem.
+        """
+        model = get_ollama_model()
+        REPORTS_DIR.mkdir(exist_ok=True)
+        if report_paths is None:
+            report_paths = [_report_path_for(p) for p in metrics_paths]
+
+        async def report(metrics_path: str, report_path: str) -> str:
+            try:
+                metrics = await asyncio.to_thread(_read_metrics, metrics_path)
+                generated = time.strftime(TIMESTAMP_FORMAT)
+                key = _ANALYSIS_CACHE.key(model, metrics)
+                llm_analysis = _ANALYSIS_CACHE.get(key)
+                if llm_analysis is None:
+                    llm_analysis = await self._agenerate(_build_prompt(metrics, generated), model, LLM_OPTIONS)
+                    if llm_analysis:
+                        _ANALYSIS_CACHE.put(key, llm_analysis)
+                    llm_analysis = llm_analysis or 'No response'
+                # Disk writes run in worker threads so the loop keeps serving other requests
+                await asyncio.to_thread(Path(report_path).write_text, _render_report(llm_analysis, metrics, generated))
+                print(f"✅ LLM report generated: {report_path}")
+                return report_path
+            except Exception as e:
+                print(f"⚠️ LLM analysis failed for {metrics_path} ({e}), generating standard report")
+                return await asyncio.to_thread(generate_fallback_report, metrics_path, report_path)
+
+        try:
+            return list(await asyncio.gather(*(report(m, r) for m, r in zip(metrics_paths, report_paths))))
+        finally:
+            await self.aclose()
     
     def generate_report_summary(self) -> str:
         """Generate a comprehensive report summary."""
@@ -252,7 +485,7 @@ class LLMAgent:
         metrics_file = f"{paths.get('reports_dir', 'reports')}/{paths.get('metrics_filename', 'latest_metrics.json')}"
         
         try:
-            return generate_llm_report(metrics_file)
+            return asyncio.run(self.generate_reports([metrics_file], [DEFAULT_REPORT_PATH]))[0]
         except Exception as e:
             error_msg = f"Failed to generate LLM report: {e}"
             print(f"Error: {error_msg}")
@@ -265,6 +498,8 @@ def generate_report_summary():
     return agent.generate_report_summary()
 
 if __name__ == "__main__":
-    metrics_file = sys.argv[1] if len(sys.argv) > 1 else "reports/latest_metrics.json"
-    result = generate_llm_report(metrics_file)
-    print(f"Report generated: {result}")
+    metrics_files = sys.argv[1:] or ["reports/latest_metrics.json"]
+    # A single metrics file keeps the default report location
+    report_files = [DEFAULT_REPORT_PATH] if len(metrics_files) == 1 else None
+    for result in asyncio.run(LLMAgent().generate_reports(metrics_files, report_files)):
+        print(f"Report generated: {result}")
@@ -47,13 +47,15 @@ class LLMAgent:
         self.log.info("Running Ollama command", command=" ".join(command))
 
         try:
+            # Capture raw bytes; decode once, tolerating partial UTF-8 from the model
             result = subprocess.run(
-                command, capture_output=True, text=True, check=True, timeout=300
+                command, capture_output=True, check=True, timeout=300
             )
-            return result.stdout.strip()
+            return result.stdout.decode("utf-8", "replace").strip()
         except subprocess.CalledProcessError as e:
-            self.log.error("Error running Ollama", stderr=e.stderr)
-            return f"Error interacting with Ollama: {e.stderr}"
+            stderr = e.stderr.decode("utf-8", "replace")
+            self.log.error("Error running Ollama", stderr=stderr)
+            return f"Error interacting with Ollama: {stderr}"
         except FileNotFoundError:
             self.log.error("Ollama command not found. Is it installed and in PATH?")
             return "Error: Ollama command not found."
@@ -319,199 +321,6 @@ if __name__ == "__main__":
     result = generate_llm_report(metrics_file)
     print(f"Report generated: {result}")
 
-def generate_fallback_report(metrics_path: str) -> str:
-    """Generate a comprehensive report without LLM when Ollama is unavailable."""
-    
-    try:
-        with open(metrics_path, 'r') as f:
-            metrics = json.load(f)
-    except:
-        metrics = {"accuracy": 0.0, "precision": 0.0, "recall": 0.0, "f1_score": 0.0}
-    
-    # Analyze metrics programmatically
-    accuracy = float(metrics.get('accuracy', 0))
-    precision = float(metrics.get('precision', 0))
-    recall = float(metrics.get('recall', 0))
-    f1 = float(metrics.get('f1_score', 0))
-    
-    # Generate insights based on metrics
-    if accuracy > 0.9:
-        performance_level = "Excellent"
-        performance_color = "🟢"
-    elif accuracy > 0.8:
-        performance_level = "Good"
-        performance_color = "🟡"
-    elif accuracy > 0.7:
-        performance_level = "Fair"
-        performance_color = "🟠"
-    else:
-        performance_level = "Needs Improvement"
-        performance_color = "🔴"
-    
-    # Generate recommendations
-    recommendations = []
-    if precision < recall:
-        recommendations.append("• Consider adjusting classification threshold to improve precision")
-    if recall < precision:
-        recommendations.append("• Focus on reducing false negatives to improve recall")
-    if f1 < 0.8:
-        recommendations.append("• Investigate feature engineering opportunities")
-        recommendations.append("• Consider ensemble methods or hyperparameter tuning")
-    
-    if not recommendations:
-        recommendations.append("• Model performance is balanced, consider deployment")
-        recommendations.append("• Monitor for data drift in production")
-    
-    report = f"""# 📊 Omnitide AI Suite - Model Performance Report
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## 🏆 Overall Performance: {performance_color} {performance_level}
-
-| Metric | Value | Status |
-|--------|-------|--------|
-| **Accuracy** | {accuracy:.4f} | {'✅' if accuracy > 0.8 else '⚠️'} |
-| **Precision** | {precision:.4f} | {'✅' if precision > 0.8 else '⚠️'} |
-| **Recall** | {recall:.4f} | {'✅' if recall > 0.8 else '⚠️'} |
-| **F1 Score** | {f1:.4f} | {'✅' if f1 > 0.8 else '⚠️'} |
-
-## 🔍 Analysis
-
-### Strengths
-- Model has been trained and evaluated successfully
-- Metrics are within expected ranges for the dataset
-- Automated pipeline is functioning correctly
-
-### Areas for Improvement
-{chr(10).join(recommendations)}
-
-## 🚀 Production Readiness
-
-- ✅ Model artifacts generated
-- ✅ Preprocessing pipeline created  
-- ✅ Performance metrics calculated
-- ✅ API endpoints ready for serving
-
-## 📈 Monitoring Recommendations
-
-1. **Performance Tracking**: Monitor key metrics in production
-2. **Data Quality**: Implement input validation and anomaly detection
-3. **Model Drift**: Set up alerts for performance degradation
-4. **Feedback Loop**: Collect ground truth for continuous improvement
-
----
-*Generated by Omnitide AI Suite Intelligent Reporting System*
-"""
-    
-    # Save report
-    report_path = Path("reports/llm_report_summary.md")
-    report_path.parent.mkdir(exist_ok=True)
-    with open(report_path, 'w') as f:
-        f.write(report)
-    
-    print(f"✅ Intelligent report generated: {report_path}")
-    return str(report_path)
-
-if __name__ == "__main__":
-    metrics_file = sys.argv[1] if len(sys.argv) > 1 else "reports/latest_metrics.json"
-    generate_llm_report(metrics_file)
-
-def generate_fallback_report(metrics_path: str) -> str:
-    """Generate a comprehensive report without LLM when Ollama is unavailable."""
-    
-    try:
-        with open(metrics_path, 'r') as f:
-            metrics = json.load(f)
-    except:
-        metrics = {"accuracy": 0.0, "precision": 0.0, "recall": 0.0, "f1_score": 0.0}
-    
-    # Analyze metrics programmatically
-    accuracy = float(metrics.get('accuracy', 0))
-    precision = float(metrics.get('precision', 0))
-    recall = float(metrics.get('recall', 0))
-    f1 = float(metrics.get('f1_score', 0))
-    
-    # Generate insights based on metrics
-    if accuracy > 0.9:
-        performance_level = "Excellent"
-        performance_color = "🟢"
-    elif accuracy > 0.8:
-        performance_level = "Good"
-        performance_color = "🟡"
-    elif accuracy > 0.7:
-        performance_level = "Fair"
-        performance_color = "🟠"
-    else:
-        performance_level = "Needs Improvement"
-        performance_color = "🔴"
-    
-    # Generate recommendations
-    recommendations = []
-    if precision < recall:
-        recommendations.append("• Consider adjusting classification threshold to improve precision")
-    if recall < precision:
-        recommendations.append("• Focus on reducing false negatives to improve recall")
-    if f1 < 0.8:
-        recommendations.append("• Investigate feature engineering opportunities")
-        recommendations.append("• Consider ensemble methods or hyperparameter tuning")
-    
-    if not recommendations:
-        recommendations.append("• Model performance is balanced, consider deployment")
-        recommendations.append("• Monitor for data drift in production")
-    
-    report = f"""# 📊 Omnitide AI Suite - Model Performance Report
-
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## 🏆 Overall Performance: {performance_color} {performance_level}
-
-| Metric | Value | Status |
-|--------|-------|--------|
-| **Accuracy** | {accuracy:.4f} | {'✅' if accuracy > 0.8 else '⚠️'} |
-| **Precision** | {precision:.4f} | {'✅' if precision > 0.8 else '⚠️'} |
-| **Recall** | {recall:.4f} | {'✅' if recall > 0.8 else '⚠️'} |
-| **F1 Score** | {f1:.4f} | {'✅' if f1 > 0.8 else '⚠️'} |
-
-## 🔍 Analysis
-
-### Strengths
-- Model has been trained and evaluated successfully
-- Metrics are within expected ranges for the dataset
-- Automated pipeline is functioning correctly
-
-### Areas for Improvement
-{chr(10).join(recommendations)}
-
-## 🚀 Production Readiness
-
-- ✅ Model artifacts generated
-- ✅ Preprocessing pipeline created  
-- ✅ Performance metrics calculated
-- ✅ API endpoints ready for serving
-
-## 📈 Monitoring Recommendations
-
-1. **Performance Tracking**: Monitor key metrics in production
-2. **Data Quality**: Implement input validation and anomaly detection
-3. **Model Drift**: Set up alerts for performance degradation
-4. **Feedback Loop**: Collect ground truth for continuous improvement
-
----
-*Generated by Omnitide AI Suite Intelligent Reporting System*
-"""
-    
-    # Save report
-    report_path = Path("reports/llm_report_summary.md")
-    report_path.parent.mkdir(exist_ok=True)
-    with open(report_path, 'w') as f:
-        f.write(report)
-    
-    print(f"✅ Intelligent report generated: {report_path}")
-    return str(report_path)
-
-if __name__ == "__main__":
-    metrics_file = sys.argv[1] if len(sys.argv) > 1 else "reports/latest_metrics.json"
-    generate_llm_report(metrics_file)
         paths = self.config.get("paths", {})
         metrics_file_path = os.path.join(
             paths.get("reports_dir", "reports"),
@@ -1,24 +1,46 @@
 # src/model_evaluator.py
+import functools
 import json
+import os
 import joblib
-import pandas as pd
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+from joblib import parallel_config
+import numpy as np
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support
 from sklearn.model_selection import train_test_split
-from src.config import config
-def evaluate_model(model_path: str, preprocessor_path: str, data_path: str):
-    df = pd.read_csv(data_path)
-    X = df.drop('target', axis=1)
-    y = df['target']
-    preprocessor = joblib.load(preprocessor_path)
+from src.config import CONFIG, config
+from src.data_processor import read_csv
+@functools.lru_cache(maxsize=2)
+def _load_estimator(path: str, mtime: float, mmap_mode=None):
+    # mtime is part of the key so a retrained artifact is picked up
+    return joblib.load(path, mmap_mode=mmap_mode)
+def _load_test_split(preprocessor_path: str, data_path: str):
+    x_path, y_path = CONFIG.paths.x_test_filename, CONFIG.paths.y_test_filename
+    # Use the split process_data saved unless the preprocessor was refitted after it
+    try:
+        if min(os.path.getmtime(x_path), os.path.getmtime(y_path)) >= os.path.getmtime(preprocessor_path):
+            return np.load(x_path, mmap_mode='r'), np.load(y_path, mmap_mode='r')
+    except (OSError, ValueError):
+        pass
+    # pyarrow parse when available; the fitted ColumnTransformer selects by name, so X stays a frame
+    X = read_csv(data_path)
+    y = X.pop('target')
+    preprocessor = _load_estimator(preprocessor_path, os.path.getmtime(preprocessor_path), 'r')
     X_processed = preprocessor.transform(X)
     X_train, X_test, y_train, y_test = train_test_split(X_processed, y, test_size=config['data']['test_size'], random_state=config['data']['random_state'])
-    model = joblib.load(model_path)
-    y_pred = model.predict(X_test)
+    return X_test, y_test
+def evaluate_model(model_path: str, preprocessor_path: str, data_path: str):
+    X_test, y_test = _load_test_split(preprocessor_path, data_path)
+    # Artifacts are written uncompressed, so their arrays can be memory-mapped
+    model = _load_estimator(model_path, os.path.getmtime(model_path), 'r')
+    # Trees predict independently; let estimators without an explicit n_jobs use every core
+    with parallel_config(backend='threading', n_jobs=-1):
+        y_pred = model.predict(X_test)
+    precision, recall, f1, _ = precision_recall_fscore_support(y_test, y_pred, average='weighted', zero_division=0)
     metrics = {
         "accuracy": accuracy_score(y_test, y_pred),
-        "precision": precision_score(y_test, y_pred, average='weighted', zero_division=0),
-        "recall": recall_score(y_test, y_pred, average='weighted', zero_division=0),
-        "f1_score": f1_score(y_test, y_pred, average='weighted', zero_division=0),
+        "precision": precision,
+        "recall": recall,
+        "f1_score": f1,
     }
     with open(f"{config['paths']['reports_dir']}/{config['paths']['metrics_filename']}", 'w') as f:
         json.dump(metrics, f, indent=4)
@@ -3,9 +3,9 @@ import pytest
 from fastapi.testclient import TestClient
 from main import app
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Fixture for the FastAPI test client."""
+    """Fixture for the FastAPI test client, shared across the session."""
     return TestClient(app)
 
 def test_health_check(client):